@@ -14,35 +14,26 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import re
 import struct
 from parsers.table_c_parser import HypothesisParser, PropertyValueRecord
+from oaparser import ClaimedRegion, open_oa
 
 def get_table_0xc(filename):
-    """Extract Table 0xC data from an .oa file."""
-    with open(filename, 'rb') as f:
-        header = f.read(24)
-        _, _, _, _, _, used = struct.unpack('<IHHQII', header)
-        ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-        offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-        sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-        
-        for i in range(used):
-            if ids[i] == 0x0c:
-                f.seek(offsets[i])
-                return f.read(sizes[i])
-    return None
-
-def get_property_values(filename):
-    """Get property value records from a file."""
-    data = get_table_0xc(filename)
+    """Extract Table 0xC data from an .oa file as a zero-copy memoryview."""
+    return open_oa(filename).table(0x0c)
+
+def get_property_values(data):
+    """Get property value records from a file's Table 0xC data."""
     if not data:
         return []
     
-    parser = HypothesisParser(data)
-    parser.parse()
+    parser = HypothesisParser(bytes(data))
+    regions = parser.parse()
     
     result = []
-    for record in parser.records:
+    for region in regions:
+        record = region.parsed_value if isinstance(region, ClaimedRegion) else None
         if isinstance(record, PropertyValueRecord):
             result.append({
                 'offset': record.offset,
@@ -51,98 +42,139 @@ def get_property_values(filename):
             })
     return result
 
+# filename -> (table_0xc_data, property_values), so each file is parsed once
+FILE_CACHE = {}
+
+def load(filename):
+    """Load Table 0xC and its property value records, memoized by filename."""
+    cached = FILE_CACHE.get(filename)
+    if cached is None:
+        data = get_table_0xc(filename)
+        cached = FILE_CACHE[filename] = (data, get_property_values(data))
+    return cached
+
 def find_value_in_bytes(data, target_val):
     """Find where a specific 32-bit value appears in the data."""
-    locations = []
-    for i in range(0, len(data) - 3, 4):
-        val = struct.unpack_from('<I', data, i)[0]
-        if val == target_val:
-            locations.append(i)
-    return locations
+    # Search in C and keep only 4-byte aligned hits, matching the aligned word
+    # scan this used to do. The lookahead also reports overlapping matches, and
+    # re reads the memoryview from open_oa() in place instead of copying it.
+    needle = re.compile(b'(?=' + re.escape(struct.pack('<I', target_val)) + b')')
+    return [m.start() for m in needle.finditer(data) if m.start() % 4 == 0]
 
-def main():
-    print("="*80)
-    print("RESISTANCE VALUE CHANGE ANALYSIS")
-    print("="*80)
-    
-    files = [
-        ('files/rc/sch5.oa', 'R0 = 2K (first time)', 70),
-        ('files/rc/sch9.oa', 'R1 = 2K (string exists)', 124),
-        ('files/rc/sch10.oa', 'R1 = 3K (new string)', 126),
-        ('files/rc/sch14.oa', 'Mystery file', 136),
-    ]
-    
-    print("\n" + "="*80)
-    print("PROPERTY VALUE ID SUMMARY")
-    print("="*80)
-    
-    for filename, description, expected_id in files:
-        pvs = get_property_values(filename)
-        print(f"\n{filename} - {description}")
-        print(f"  Expected Property Value ID: {expected_id}")
-        print(f"  Found {len(pvs)} PropertyValueRecords:")
-        for pv in pvs:
-            marker = " <-- TARGET" if pv['value_id'] == expected_id else ""
-            print(f"    Offset 0x{pv['offset']:04x}: ID {pv['value_id']:3d}{marker}")
+def changed_offsets(a, b):
+    """Offsets where two equal-length buffers differ, found without a per-byte loop."""
+    # XOR the buffers as big integers; equal bytes become 0x00, so a single
+    # regex scan over the result yields exactly the differing offsets
+    n = len(a)
+    xored = (int.from_bytes(a, 'little') ^ int.from_bytes(b, 'little')).to_bytes(n, 'little')
+    return [m.start() for m in re.finditer(rb'[^\x00]', xored)]
+
+FILES = [
+    ('files/rc/sch5.oa', 'R0 = 2K (first time)', 70),
+    ('files/rc/sch9.oa', 'R1 = 2K (string exists)', 124),
+    ('files/rc/sch10.oa', 'R1 = 3K (new string)', 126),
+    ('files/rc/sch14.oa', 'Mystery file', 136),
+]
+
+def section_header(out, title):
+    out.append("\n" + "="*80)
+    out.append(title)
+    out.append("="*80)
+
+def analyze_file(entry):
+    """
+    Parse one file and format its per-file report lines: the lines for the
+    property value summary and the lines for the raw byte locations.
+    """
+    filename, description, expected_id = entry
+    data, pvs = load(filename)
     
-    print("\n" + "="*80)
-    print("RAW BYTE LOCATIONS OF PROPERTY VALUE IDs")
-    print("="*80)
+    summary = [f"\n{filename} - {description}",
+               f"  Expected Property Value ID: {expected_id}",
+               f"  Found {len(pvs)} PropertyValueRecords:"]
+    for pv in pvs:
+        marker = " <-- TARGET" if pv['value_id'] == expected_id else ""
+        summary.append(f"    Offset 0x{pv['offset']:04x}: ID {pv['value_id']:3d}{marker}")
     
-    for filename, description, expected_id in files:
-        data = get_table_0xc(filename)
-        locations = find_value_in_bytes(data, expected_id)
-        print(f"\n{filename} - Property Value ID {expected_id}:")
-        for loc in locations:
-            context_start = max(0, loc - 12)
-            context_end = min(len(data), loc + 16)
-            hex_str = ' '.join(f'{b:02x}' for b in data[context_start:context_end])
-            print(f"  Offset 0x{loc:04x}: {hex_str}")
+    locations = [f"\n{filename} - Property Value ID {expected_id}:"]
+    for loc in find_value_in_bytes(data, expected_id):
+        context_start = max(0, loc - 12)
+        context_end = min(len(data), loc + 16)
+        hex_str = data[context_start:context_end].hex(' ')
+        locations.append(f"  Offset 0x{loc:04x}: {hex_str}")
+    return summary, locations
+
+def per_file_sections(files):
+    """Analyze every file and assemble the two per-file sections."""
+    # A few KB of Table 0xC per file parse in about a millisecond, so a
+    # serial loop beats a process pool and keeps FILE_CACHE shared
+    results = [analyze_file(entry) for entry in files]
     
-    print("\n" + "="*80)
-    print("BYTE-LEVEL DIFF: sch9 (2K) → sch10 (3K)")
-    print("="*80)
+    summary = []
+    section_header(summary, "PROPERTY VALUE ID SUMMARY")
+    locations = []
+    section_header(locations, "RAW BYTE LOCATIONS OF PROPERTY VALUE IDs")
+    for file_summary, file_locations in results:
+        summary.extend(file_summary)
+        locations.extend(file_locations)
+    return summary, locations
+
+def byte_level_diff():
+    out = []
+    section_header(out, "BYTE-LEVEL DIFF: sch9 (2K) → sch10 (3K)")
     
-    data9 = get_table_0xc('files/rc/sch9.oa')
-    data10 = get_table_0xc('files/rc/sch10.oa')
+    # Both files were already loaded for the per-file sections
+    data9, _ = load('files/rc/sch9.oa')
+    data10, _ = load('files/rc/sch10.oa')
     
-    print(f"\nTable sizes: sch9={len(data9)} bytes, sch10={len(data10)} bytes")
+    out.append(f"\nTable sizes: sch9={len(data9)} bytes, sch10={len(data10)} bytes")
     
     if len(data9) == len(data10):
-        print("Tables are same size - checking differences:")
-        diffs = []
-        for i in range(len(data9)):
-            if data9[i] != data10[i]:
-                diffs.append((i, data9[i], data10[i]))
+        out.append("Tables are same size - checking differences:")
+        diffs = [(i, data9[i], data10[i]) for i in changed_offsets(data9, data10)]
         
-        print(f"Found {len(diffs)} byte differences:")
+        out.append(f"Found {len(diffs)} byte differences:")
         for offset, old_val, new_val in diffs[:20]:  # Show first 20
             context_start = max(0, offset - 8)
             context_end = min(len(data9), offset + 8)
-            old_context = ' '.join(f'{b:02x}' for b in data9[context_start:context_end])
-            new_context = ' '.join(f'{b:02x}' for b in data10[context_start:context_end])
-            print(f"\n  Offset 0x{offset:04x}:")
-            print(f"    sch9:  {old_context}")
-            print(f"    sch10: {new_context}")
-            print(f"    Change: 0x{old_val:02x} → 0x{new_val:02x} (124=0x7c, 126=0x7e)")
-    
-    print("\n" + "="*80)
-    print("PATTERN ANALYSIS: Property Value ID Increments")
-    print("="*80)
+            old_context = data9[context_start:context_end].hex(' ')
+            new_context = data10[context_start:context_end].hex(' ')
+            out.append(f"\n  Offset 0x{offset:04x}:")
+            out.append(f"    sch9:  {old_context}")
+            out.append(f"    sch10: {new_context}")
+            out.append(f"    Change: 0x{old_val:02x} → 0x{new_val:02x} (124=0x7c, 126=0x7e)")
+    return out
+
+def pattern_analysis():
+    out = []
+    section_header(out, "PATTERN ANALYSIS: Property Value ID Increments")
     
-    print("\nObserved sequence:")
-    print("  sch5:  ID  70 - R0 = 2K (new string added)")
-    print("  sch9:  ID 124 - R1 = 2K (string reused, but NEW property value ID)")
-    print("  sch10: ID 126 - R1 = 3K (delta +2 from 124)")
-    print("  sch14: ID 136 - Mystery (delta +10 from 126)")
+    out.append("\nObserved sequence:")
+    out.append("  sch5:  ID  70 - R0 = 2K (new string added)")
+    out.append("  sch9:  ID 124 - R1 = 2K (string reused, but NEW property value ID)")
+    out.append("  sch10: ID 126 - R1 = 3K (delta +2 from 124)")
+    out.append("  sch14: ID 136 - Mystery (delta +10 from 126)")
     
-    print("\nKey insights:")
-    print("  1. Property Value IDs are NOT string offsets")
-    print("  2. Same string value can have different Property Value IDs")
-    print("  3. IDs increment by +2 for simple property changes")
-    print("  4. IDs track modification history, not just final values")
+    out.append("\nKey insights:")
+    out.append("  1. Property Value IDs are NOT string offsets")
+    out.append("  2. Same string value can have different Property Value IDs")
+    out.append("  3. IDs increment by +2 for simple property changes")
+    out.append("  4. IDs track modification history, not just final values")
     
-    print("\n" + "="*80)
+    out.append("\n" + "="*80)
+    return out
+
+def write_section(lines):
+    """Write a whole report section with a single stdout call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def main():
+    write_section(["="*80, "RESISTANCE VALUE CHANGE ANALYSIS", "="*80])
+    summary, locations = per_file_sections(FILES)
+    write_section(summary)
+    write_section(locations)
+    write_section(byte_level_diff())
+    write_section(pattern_analysis())
 
 if __name__ == '__main__':
     main()
@@ -6,6 +6,11 @@ This script shows how the overlap detection prevents common mistakes
 in binary reverse engineering.
 """
 
+import sys
+import os
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from oaparser import BinaryCurator
 import struct
 
@@ -8,7 +8,11 @@ meaningful diffs?"
 """
 
 import sys
-import subprocess
+import os
+# Add tools directory to path so the comparison runs in-process
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tools'))
+
+from compare_property_values import compare_files
 
 def run_comparison(file1, file2, description):
     """Run a comparison and display results."""
@@ -18,15 +22,7 @@ def run_comparison(file1, file2, description):
     print(f"Comparing: {file1} → {file2}\n")
     
     try:
-        result = subprocess.run(
-            ['python3', 'compare_property_values.py', file1, file2],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        print(result.stdout)
-        if result.returncode != 0:
-            print(f"Error: {result.stderr}")
+        compare_files(file1, file2)
     except Exception as e:
         print(f"Error running comparison: {e}")
     
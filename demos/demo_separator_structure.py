@@ -15,29 +15,19 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import struct
-from parsers.table_c_parser import HypothesisParser
+from oaparser import open_oa
+from parsers.table_c_parser import HypothesisParser, UnknownStruct60Byte
+
+# Marker that some records carry in their trailing separator
+MARKER = b'\xff\xff\xff\xff'
 
 def extract_table_0xc(filename):
     """Extract table 0xc and string table from .oa file"""
     try:
-        with open(filename, 'rb') as f:
-            header = f.read(24)
-            _, _, _, _, _, used = struct.unpack('<IHHQII', header)
-            ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            
-            string_table_data = None
-            for i in range(used):
-                if ids[i] == 0x0a:
-                    f.seek(offsets[i])
-                    string_table_data = f.read(sizes[i])
-                    break
-            
-            for i in range(used):
-                if ids[i] == 0x0c:
-                    f.seek(offsets[i])
-                    return f.read(sizes[i]), string_table_data
+        with open_oa(filename) as oa:
+            table_c = oa.read(0x0c)
+            if table_c is not None:
+                return table_c, oa.read(0x0a)
         return None, None
     except:
         return None, None
@@ -90,14 +80,14 @@ def main():
             
             found = False
             for region in regions:
-                if hasattr(region, 'parsed_value') and type(region.parsed_value).__name__ == 'UnknownStruct60Byte':
+                if isinstance(getattr(region, 'parsed_value', None), UnknownStruct60Byte):
                     rec = region.parsed_value
                     if len(rec.payload) % 4 == 0:
-                        payload_ints = list(struct.unpack(f'<{len(rec.payload)//4}I', rec.payload))
+                        payload_ints = [v for (v,) in struct.iter_unpack('<I', rec.payload)]
                     else:
                         payload_ints = []
                     
-                    has_marker = b'\xff\xff\xff\xff' in rec.trailing_separator
+                    has_marker = MARKER in rec.trailing_separator
                     marker_str = "0xffffffff" if has_marker else "None"
                     
                     payload_str = str(payload_ints)
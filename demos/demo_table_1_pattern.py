@@ -6,38 +6,39 @@ This script extracts and compares the counters and key fields from Table 0x1
 to show how they change between file modifications.
 """
 
+import sys
+import os
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import struct
 import glob
-import sys
+
+from oaparser import open_oa
+
+# Table 0x1 key fields at 0x68: counter1, counter2, ts1, ts2 (contiguous)
+KEY_FIELDS = struct.Struct('<IIQQ')
 
 def extract_table_1_key_fields(filepath):
     """Extract key fields from Table 0x1."""
     try:
-        with open(filepath, 'rb') as f:
-            header = f.read(24)
-            _, _, _, _, _, used = struct.unpack('<IHHQII', header)
-            ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            
-            if 0x1 not in ids:
+        with open_oa(filepath) as oa:
+            data = oa.read(0x1)
+            if data is None:
                 return None
             
-            idx = ids.index(0x1)
-            f.seek(offsets[idx])
-            data = f.read(sizes[idx])
+            size = oa.tables[0x1].size
             
             if len(data) < 0x80:
                 return None
             
             # Extract key fields
-            counter1 = struct.unpack_from('<I', data, 0x68)[0]
-            counter2 = struct.unpack_from('<I', data, 0x6c)[0]
-            ts1 = struct.unpack_from('<Q', data, 0x70)[0] & 0xFFFFFFFF
-            ts2 = struct.unpack_from('<Q', data, 0x78)[0] & 0xFFFFFFFF
+            counter1, counter2, ts1, ts2 = KEY_FIELDS.unpack_from(data, 0x68)
+            ts1 &= 0xFFFFFFFF
+            ts2 &= 0xFFFFFFFF
             
             return {
-                'size': sizes[idx],
+                'size': size,
                 'counter1': counter1,
                 'counter2': counter2,
                 'ts1': ts1,
@@ -4,6 +4,7 @@ OA Parser - Binary file parsing utilities for OpenAccess format files
 
 from .binary_curator import BinaryCurator, Region, ClaimedRegion, UnclaimedRegion, NestedUnclaimedData
 from .oa_renderer import render_report, render_regions_to_string, summarized_hex_dump
+from .oa_file import HEADER, INVALID_OFFSET, OaFileMap, TableEntry, u64_struct, unpack_directory, u64_array, open_oa, same_payload, file_digest
 
 __all__ = [
     'BinaryCurator', 
@@ -13,5 +14,15 @@ __all__ = [
     'NestedUnclaimedData',
     'render_report',
     'render_regions_to_string',
-    'summarized_hex_dump'
+    'summarized_hex_dump',
+    'HEADER',
+    'INVALID_OFFSET',
+    'OaFileMap',
+    'TableEntry',
+    'u64_struct',
+    'unpack_directory',
+    'u64_array',
+    'open_oa',
+    'same_payload',
+    'file_digest'
 ]
@@ -83,9 +83,14 @@ must enforce it. Violating this rule defeats the purpose of reverse
 engineering, which is to UNDERSTAND the data format.
 """
 
+import bisect
 import struct
 from dataclasses import dataclass, field
-from typing import List, Any, Callable, Optional
+from typing import List, Any, Callable, Optional, Tuple
+
+# Translation table for the ASCII column of hex dumps: printable bytes map
+# to themselves, everything else to '.'
+ASCII_TABLE = bytes(b if 32 <= b <= 126 else ord('.') for b in range(256))
 
 # --- Base Region Class ---
 @dataclass
@@ -128,8 +133,8 @@ class NestedUnclaimedData:
             display_size = min(len(self.data), 256)
             for i in range(0, display_size, 16):
                 chunk = self.data[i:i+16]
-                hex_part = ' '.join(f'{b:02x}' for b in chunk)
-                ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
+                hex_part = chunk.hex(' ')
+                ascii_part = chunk.translate(ASCII_TABLE).decode('ascii')
                 lines.append(f"    {i:04x}: {hex_part:<48} |{ascii_part}|")
             
             if len(self.data) > 256:
@@ -154,6 +159,9 @@ class BinaryCurator:
         self.data = data
         self.cursor = 0
         self.regions: List[ClaimedRegion] = []
+        # (start, end) of every claimed region, kept sorted. Claimed regions
+        # never overlap, so ends are non-decreasing in this order too.
+        self._spans: List[Tuple[int, int]] = []
 
     def seek(self, offset: int):
         """Moves the internal cursor to an absolute offset."""
@@ -197,16 +205,21 @@ class BinaryCurator:
         start = self.cursor
         end = start + size
         
-        # Check for overlaps with existing regions
-        for existing in self.regions:
-            existing_end = existing.start + existing.size
-            # Check if new region overlaps with existing region
-            if not (end <= existing.start or start >= existing_end):
-                raise ValueError(
-                    f"Overlap detected! Attempting to claim '{name}' at offset {start}-{end-1} "
-                    f"(size {size}), but it overlaps with '{existing.name}' at offset "
-                    f"{existing.start}-{existing_end-1} (size {existing.size})."
-                )
+        # Check for overlaps with existing regions. Of the regions starting
+        # before `end`, the last in sorted order reaches furthest, so it is
+        # the only one that needs checking against `start`.
+        i = bisect.bisect_left(self._spans, (end,))
+        if i and self._spans[i - 1][1] > start:
+            # Report the first overlapping region in claim order
+            for existing in self.regions:
+                existing_end = existing.start + existing.size
+                # Check if new region overlaps with existing region
+                if not (end <= existing.start or start >= existing_end):
+                    raise ValueError(
+                        f"Overlap detected! Attempting to claim '{name}' at offset {start}-{end-1} "
+                        f"(size {size}), but it overlaps with '{existing.name}' at offset "
+                        f"{existing.start}-{existing_end-1} (size {existing.size})."
+                    )
         
         raw_chunk = self.data[start : start + size]
         
@@ -223,6 +236,7 @@ class BinaryCurator:
             parsed_value=parsed
         )
         self.regions.append(region)
+        bisect.insort(self._spans, (start, end))
         self.cursor += size # Automatically advance the cursor
 
     def get_regions(self) -> List[Region]:
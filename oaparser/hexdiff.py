@@ -0,0 +1,208 @@
+"""
+Hex-dump and uint32 views of table payloads, and a positional unified diff
+over them.
+
+Every view line starts with its own offset, so two views are diffed by
+pairing lines up by index rather than by searching for matching blocks.
+TableRows lets the diff compare raw fixed-width rows and format only the
+lines that end up in a hunk.
+"""
+
+import struct
+
+from .binary_curator import ASCII_TABLE
+
+# --- Helper function for clean hex dumps ---
+def hex_dump_line(row, chunk):
+    """Formats one 16-byte row of a hex dump; row is the row index."""
+    # bytes.hex() and bytes.translate() format the whole row in C
+    hex_part = chunk.hex(' ')
+    ascii_part = chunk.translate(ASCII_TABLE).decode('ascii')
+    return f"{row * 16:08x}: {hex_part:<48} |{ascii_part}|"
+
+def get_hex_dump_lines(data):
+    """Creates a complete, formatted hex dump of a byte string as a list of lines."""
+    return [hex_dump_line(row, data[i:i+16]) for row, i in enumerate(range(0, len(data), 16))]
+
+# Bound format method for one int32 view line: index, offset, hex bytes, value, value
+INT32_LINE = "Index {:04d} | Offset 0x{:04x}:  {:<12} ->  Value: {} (0x{:x})".format
+
+def pad_to_words(data):
+    """Pads data with zero bytes to a multiple of 4 bytes for a clean array view."""
+    padding = len(data) % 4
+    if padding != 0:
+        data += b'\x00' * (4 - padding)
+    return data
+
+def int32_view_line(index, word):
+    """Formats one 4-byte little-endian word of the uint32_t array view."""
+    value = int.from_bytes(word, 'little')
+    return INT32_LINE(index, index * 4, word.hex(' '), value, value)
+
+# --- Helper function for uint32_t array view ---
+def get_int32_view_lines(data):
+    """
+    Parses a byte array as a flat list of 32-bit unsigned little-endian integers
+    and returns the view as a list of formatted strings.
+    """
+    data = pad_to_words(data)
+
+    # One iter_unpack pass decodes every value instead of an unpack per slice,
+    # and each line is built by the prebound INT32_LINE template
+    return [INT32_LINE(i, i * 4, data[i * 4:i * 4 + 4].hex(' '), value, value)
+            for i, (value,) in enumerate(struct.iter_unpack('<I', data))]
+
+# --- Positional line diff for offset-prefixed views ---
+def positional_opcodes(a, b):
+    """
+    Returns difflib-style opcodes for a and b with lines paired up by index
+    instead of by a search for matching blocks.
+
+    Every hex-dump and int32-view line starts with its own offset, so two
+    lines can only be equal at the same index. The longest matching blocks
+    are then exactly the runs of positionally equal lines, which this finds
+    in one O(n) pass instead of SequenceMatcher's worst-case O(n*m) search.
+    """
+    common = min(len(a), len(b))
+    # Rows of two tables can skip over equal runs by comparing whole
+    # blocks of rows at once instead of one row at a time
+    block_compare = (isinstance(a, TableRows) and isinstance(b, TableRows)
+                     and a.width == b.width)
+    opcodes = []
+    i = 0
+    while i < common:
+        equal = a[i] == b[i]
+        j = i + 1
+        if equal and block_compare:
+            j += a.equal_rows(b, j, common)
+        else:
+            while j < common and (a[j] == b[j]) == equal:
+                j += 1
+        opcodes.append(('equal' if equal else 'replace', i, j, i, j))
+        i = j
+    # Lines past the shorter view extend a trailing replace, as
+    # SequenceMatcher would report it, or stand alone as insert/delete
+    if len(a) != len(b):
+        if opcodes and opcodes[-1][0] == 'replace':
+            _, i1, _, j1, _ = opcodes.pop()
+        else:
+            i1 = j1 = common
+        tag = 'replace' if i1 < common else ('delete' if len(a) > len(b) else 'insert')
+        opcodes.append((tag, i1, len(a), j1, len(b)))
+    return opcodes
+
+def group_opcodes(opcodes, n=3):
+    """
+    Yields the hunks of opcodes with up to n lines of context each, grouped
+    the same way as SequenceMatcher.get_grouped_opcodes().
+    """
+    codes = list(opcodes) or [('equal', 0, 1, 0, 1)]
+    # Trim the leading and trailing equal runs down to n lines of context
+    if codes[0][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        # An equal run longer than twice the context splits the hunk
+        if tag == 'equal' and i2 - i1 > 2 * n:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == 'equal'):
+        yield group
+
+def _hunk_range(start, stop):
+    """Formats the start,length range of a unified diff hunk header."""
+    length = stop - start
+    if length == 1:
+        return f"{start + 1}"
+    return f"{start + 1 if length else start},{length}"
+
+def positional_unified_diff(a, b, n=1, format_line=None):
+    """
+    Yields the lines of difflib.unified_diff(a, b, n=n, lineterm='') for
+    lines paired up by positional_opcodes().
+
+    With format_line, a and b are sequences of raw rows (such as TableRows)
+    that are compared as bytes, and format_line(index, row) builds the text
+    of only the rows that end up in a hunk.
+    """
+    if format_line is None:
+        format_line = lambda index, line: line
+    started = False
+    for group in group_opcodes(positional_opcodes(a, b), n):
+        if not started:
+            yield '--- '
+            yield '+++ '
+            started = True
+        first, last = group[0], group[-1]
+        yield f"@@ -{_hunk_range(first[1], last[2])} +{_hunk_range(first[3], last[4])} @@"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                for i in range(i1, i2):
+                    yield ' ' + format_line(i, a[i])
+                continue
+            if tag in ('replace', 'delete'):
+                for i in range(i1, i2):
+                    yield '-' + format_line(i, a[i])
+            if tag in ('replace', 'insert'):
+                for j in range(j1, j2):
+                    yield '+' + format_line(j, b[j])
+
+class TableRows:
+    """
+    The fixed-width rows of a table payload as a sequence, sliced out only
+    when indexed, so a diff never holds a formatted copy of the whole table.
+    Rows are returned as bytes, also when data is a memoryview.
+    """
+    def __init__(self, data, width):
+        self.data = data
+        self.width = width
+
+    def __len__(self):
+        return -(-len(self.data) // self.width)
+
+    def __getitem__(self, index):
+        rows = len(self)
+        if index < 0:
+            index += rows
+        if not 0 <= index < rows:
+            raise IndexError('TableRows index out of range')
+        start = index * self.width
+        return bytes(self.data[start:start + self.width])
+
+    def equal_rows(self, other, start, stop):
+        """
+        Number of rows from start (up to stop) that are equal in both tables.
+
+        Gallops through doubling blocks of rows compared as one slice, then
+        halves the first block that differs, so a run of n equal rows costs
+        O(log n) slice compares rather than n row compares.
+        """
+        width = self.width
+        a, b = self.data, other.data
+        count, step = 0, 64
+        while True:
+            rows = min(step, stop - start - count)
+            if rows <= 0:
+                return count
+            lo = (start + count) * width
+            if a[lo:lo + rows * width] != b[lo:lo + rows * width]:
+                break
+            count += rows
+            step *= 2
+        # The first differing row is within the next `rows` rows
+        while rows > 1:
+            half = rows // 2
+            lo = (start + count) * width
+            if a[lo:lo + half * width] == b[lo:lo + half * width]:
+                count += half
+                rows -= half
+            else:
+                rows = half
+        return count
@@ -0,0 +1,160 @@
+"""
+Memory-mapped access to .oa files.
+
+An .oa file starts with a 24-byte preface followed by the table directory:
+three parallel arrays of 64-bit table IDs, absolute offsets and sizes.
+OaFileMap maps the file read-only, parses the directory once, and hands out
+each table's payload as a memoryview slice of the mapping, so no table bytes
+are copied until a caller asks for them.
+"""
+
+import array
+import hashlib
+import mmap
+import struct
+import sys
+from typing import Dict, NamedTuple, Optional, Tuple
+
+# Preface layout: test_bit, type, schema, offset, size, used
+HEADER = struct.Struct('<IHHQII')
+
+# Compiled '<{count}Q' structs, keyed by count
+_U64_STRUCTS: Dict[int, struct.Struct] = {}
+
+
+def u64_struct(count: int) -> struct.Struct:
+    """Returns a cached Struct that unpacks `count` little-endian uint64s."""
+    s = _U64_STRUCTS.get(count)
+    if s is None:
+        s = _U64_STRUCTS[count] = struct.Struct(f'<{count}Q')
+    return s
+
+
+def u64_array(data) -> array.array:
+    """
+    Returns little-endian uint64 data as an array.array('Q').
+
+    The values stay unboxed in one buffer instead of a list of Python ints,
+    and `in`/index() compare them in C.
+    """
+    values = array.array('Q')
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def unpack_directory(buffer, used: int, offset: int = HEADER.size) -> Tuple[tuple, tuple, tuple]:
+    """
+    Unpacks the table directory at `offset` of buffer into (ids, offsets, sizes).
+
+    The three columns of `used` uint64s each are contiguous, so they are
+    unpacked with one cached Struct. The default offset is right after the
+    preface, for a buffer holding the start of the file; pass 0 for a buffer
+    holding only the directory.
+    """
+    directory = u64_struct(3 * used).unpack_from(buffer, offset)
+    return directory[:used], directory[used:2 * used], directory[2 * used:]
+
+
+# Directory offset marking a table that is listed but has no data
+INVALID_OFFSET = 0xffffffffffffffff
+
+
+class TableEntry(NamedTuple):
+    """Location of one table's payload inside the file."""
+    offset: int
+    size: int
+
+
+class OaFileMap:
+    """
+    A read-only memory map of an .oa file together with its table directory.
+
+    The mapping stays open for the lifetime of this object, so memoryviews
+    returned by table() remain valid as long as the OaFileMap is alive.
+    """
+
+    __slots__ = ('filepath', 'mm', 'tables')
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        with open(filepath, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        _, _, _, _, _, used = HEADER.unpack_from(self.mm, 0)
+        ids, offsets, sizes = unpack_directory(self.mm, used)
+
+        # table_id -> TableEntry, skipping tables without data
+        self.tables: Dict[int, TableEntry] = {
+            table_id: TableEntry(offset, size)
+            for table_id, offset, size in zip(ids, offsets, sizes)
+            if offset != INVALID_OFFSET
+        }
+
+    def table(self, table_id: int) -> Optional[memoryview]:
+        """Returns a zero-copy view of a table's payload, or None if absent."""
+        entry = self.tables.get(table_id)
+        if entry is None:
+            return None
+        offset, size = entry
+        return memoryview(self.mm)[offset:offset + size]
+
+    def read(self, table_id: int) -> Optional[bytes]:
+        """Returns a copy of a table's payload as bytes, or None if absent."""
+        entry = self.tables.get(table_id)
+        if entry is None:
+            return None
+        offset, size = entry
+        return self.mm[offset:offset + size]
+
+    def close(self):
+        """Closes the mapping. Views returned by table() must be released first."""
+        self.mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# Chunk size for same_payload(); bounds the temporary copies it makes
+COMPARE_CHUNK = 1 << 20
+
+
+def same_payload(a, b) -> bool:
+    """
+    Returns True if two table payloads hold the same bytes.
+
+    Payloads of different sizes are rejected without reading them. Equal-size
+    payloads are compared chunk by chunk as bytes, which uses memcmp, whereas
+    comparing memoryviews directly goes element by element.
+    """
+    if len(a) != len(b):
+        return False
+    a, b = memoryview(a), memoryview(b)
+    for start in range(0, len(a), COMPARE_CHUNK):
+        end = start + COMPARE_CHUNK
+        if a[start:end].tobytes() != b[start:end].tobytes():
+            return False
+    return True
+
+
+def file_digest(filepath: str) -> bytes:
+    """
+    Returns the SHA-256 digest of a whole file.
+
+    Comparing two digests tells whether a pair of files is byte-identical
+    without parsing either of them.
+    """
+    h = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(COMPARE_CHUNK), b''):
+            h.update(chunk)
+    return h.digest()
+
+
+def open_oa(filepath: str) -> OaFileMap:
+    """Memory-maps an .oa file and parses its table directory."""
+    return OaFileMap(filepath)
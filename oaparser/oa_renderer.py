@@ -6,7 +6,7 @@ It takes structured region data and renders it in a human-readable format.
 """
 
 from typing import List
-from .binary_curator import Region, UnclaimedRegion, ClaimedRegion
+from .binary_curator import Region, UnclaimedRegion, ClaimedRegion, ASCII_TABLE
 
 
 def summarized_hex_dump(data: bytes, indent: str = "  "):
@@ -37,8 +37,8 @@ def summarized_hex_dump(data: bytes, indent: str = "  "):
             # Print a standard 16-byte line
             end = min(i + 16, len(data))
             chunk = data[i:end]
-            hex_part = ' '.join(f'{b:02x}' for b in chunk)
-            ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
+            hex_part = chunk.hex(' ')
+            ascii_part = chunk.translate(ASCII_TABLE).decode('ascii')
             print(f"{indent}{i:04x}: {hex_part:<48} |{ascii_part}|")
             i += 16
 
@@ -107,8 +107,8 @@ def render_regions_to_string(regions: List[Region], title: str = "Binary Analysi
                 else:
                     end = min(i + 16, len(region.raw_data))
                     chunk = region.raw_data[i:end]
-                    hex_part = ' '.join(f'{b:02x}' for b in chunk)
-                    ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
+                    hex_part = chunk.hex(' ')
+                    ascii_part = chunk.translate(ASCII_TABLE).decode('ascii')
                     lines.append(f"  {i:04x}: {hex_part:<48} |{ascii_part}|")
                     i += 16
             
@@ -4,6 +4,8 @@
 import struct
 import ctypes
 
+from oaparser import HEADER, u64_array, unpack_directory
+
 class OaFileParser:
     def __init__(self):
         self.table_map = {
@@ -32,6 +34,13 @@ class OaFileParser:
         rem = length % 8
         return length + (8 - rem) if rem != 0 else length
 
+    def _read_u64_array(self, file, count):
+        # u64_array() would silently return fewer values from a short read
+        data = file.read(8 * count)
+        if len(data) != 8 * count:
+            raise struct.error(f"unpack requires a buffer of {8 * count} bytes")
+        return u64_array(data)
+
     def _read_0x04(self, file, pos, tbl_size):
         file.seek(pos)
         flags = struct.unpack('<I', file.read(4))[0]
@@ -51,9 +60,9 @@ class OaFileParser:
         file.seek(pos)
         num_res, num_data = struct.unpack('<II', file.read(8))
         num_other = num_data - num_res
-        ids = list(struct.unpack(f'<{num_res}Q', file.read(8 * num_res)))
+        ids = self._read_u64_array(file, num_res)
         types = list(struct.unpack(f'<{num_res}I', file.read(4 * num_res)))
-        tbl_ids = list(struct.unpack(f'<{num_other}Q', file.read(8 * num_other)))
+        tbl_ids = self._read_u64_array(file, num_other)
         tbl_types = list(struct.unpack(f'<{num_other}I', file.read(4 * num_other)))
         self.on_parsed_database_map(ids, types, tbl_ids, tbl_types)
 
@@ -89,7 +98,7 @@ class OaFileParser:
     def _read_0x1f(self, file, pos, tbl_size):
         file.seek(pos)
         num = struct.unpack('<Q', file.read(8))[0]
-        ids = list(struct.unpack(f'<{num}Q', file.read(8 * num)))
+        ids = self._read_u64_array(file, num)
         types = list(struct.unpack(f'<{num}I', file.read(4 * num)))
         self.on_parsed_database_map_d(ids, types)
 
@@ -102,12 +111,10 @@ class OaFileParser:
         try:
             with open(filepath, 'rb') as f:
                 header_bytes = f.read(24)
-                test_bit, type_val, schema, offset, size, used = struct.unpack('<IHHQII', header_bytes)
+                test_bit, type_val, schema, offset, size, used = HEADER.unpack(header_bytes)
                 self.on_parsed_preface(test_bit, type_val, schema, offset, size, used)
 
-                ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-                offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-                sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
+                ids, offsets, sizes = unpack_directory(f.read(24 * used), used, 0)
                 self.on_parsed_table_information(ids, offsets, sizes)
 
                 start_offset = 0
@@ -33,8 +33,7 @@ class Table133Parser:
         cursor = 0
         index = 0
         
-        while cursor <= len(self.data) - 4:
-            val = struct.unpack_from('<I', self.data, cursor)[0]
+        for (val,) in struct.iter_unpack('<I', self.data[:len(self.data) & ~3]):
             int_array.append(val)
             
             # Determine if this is a special value
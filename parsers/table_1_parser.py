@@ -45,7 +45,7 @@ class Table1Parser:
         curator = BinaryCurator(self.data)
 
         # --- Sequentially claim known fields from the start ---
-        curator.claim("Header bytes", 6, lambda d: ' '.join(f'{b:02x}' for b in d))
+        curator.claim("Header bytes", 6, lambda d: d.hex(' '))
 
         for i in range(3):
             if curator.cursor >= len(self.data): break
@@ -52,12 +52,9 @@ class Table1dParser:
         """
         # Parse as array of 64-bit table IDs
         if len(self.data) >= 8 and len(self.data) % 8 == 0:
-            num_entries = len(self.data) // 8
-            
-            for i in range(num_entries):
+            for i, (table_id,) in enumerate(struct.iter_unpack('<Q', self.data)):
                 # Parse this entry
                 offset = i * 8
-                table_id = struct.unpack('<Q', self.data[offset:offset+8])[0]
                 self.table_ids.append(table_id)
                 name = self.KNOWN_TABLES.get(table_id, "Unknown")
                 
@@ -60,15 +60,10 @@ class TableAParser:
         current_offset = 0
         string_index = 0
         
-        while current_offset < len(string_buffer):
-            # Find the next null terminator
-            try:
-                null_pos = string_buffer.index(b'\0', current_offset)
-            except ValueError:
-                break
-            
-            # Decode the string
-            string_data = string_buffer[current_offset:null_pos]
+        # Split once instead of searching for each terminator; the piece after
+        # the last null terminator is unterminated and is not a string
+        for string_data in string_buffer.split(b'\0')[:-1]:
+            null_pos = current_offset + len(string_data)
             
             # Claim even empty strings to be lossless
             if string_data or null_pos - current_offset > 0:
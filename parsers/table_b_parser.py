@@ -37,9 +37,9 @@ class TableBParser:
         # Claim each 4-byte record
         expected_records = min(record_count, (len(self.data) - 224) // 4)
         
-        for i in range(expected_records):
+        record_bytes = self.data[224:224 + expected_records * 4]
+        for i, (record_val,) in enumerate(struct.iter_unpack('<I', record_bytes)):
             offset = 224 + (i * 4)
-            record_val = struct.unpack_from('<I', self.data, offset)[0]
             val_low = record_val & 0xFFFF
             val_high = (record_val >> 16) & 0xFFFF
             
@@ -1,14 +1,53 @@
 # table_c_parser.py - Refactored to use BinaryCurator
+import functools
 import struct
-import datetime
+import time
 from dataclasses import dataclass, field
 from typing import List, Optional
 from oaparser.binary_curator import BinaryCurator, Region, NestedUnclaimedData
+from oaparser.oa_file import u64_struct
 import os
+import sys
+
+# Precompiled formats for the fixed-size fields read on every record
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_U32_PAIR = struct.Struct('<II')
+_U64 = struct.Struct('<Q')
+_PROPERTY_VALUE_HEAD = struct.Struct('<IIIIIIII')
 
 # --- Utility Functions ---
 def format_int(value): return f"{value} (0x{value:x})"
 
+@functools.lru_cache(maxsize=4096)
+def decode_string(raw: bytes) -> str:
+    """Decode a string table entry as UTF-8, interning and caching the result."""
+    return sys.intern(raw.decode('utf-8'))
+
+@functools.lru_cache(maxsize=16)
+def parse_string_entries(table: bytes):
+    """
+    Parse a raw string table into ((offset, string), ...) and {offset: string}.
+
+    Parsers built over the same string table (e.g. several tables of one
+    file) share the result instead of re-parsing it.
+    """
+    strings = []
+    # One split finds every terminator; the last piece is unterminated
+    offset = 0
+    for raw in table[20:].split(b'\x00')[:-1]:
+        try: strings.append((offset, decode_string(raw)))
+        except UnicodeDecodeError: pass
+        offset += len(raw) + 1
+    # Offsets are unique and ascending, so a dict gives O(1) lookups
+    return tuple(strings), dict(strings)
+
+def format_utc_timestamp(ts):
+    """Format a Unix timestamp as 'YYYY-MM-DD HH:MM:SS UTC' without strftime."""
+    t = time.gmtime(ts)
+    return (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+            f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d} UTC")
+
 def is_plausible_string_offset(value):
     """Check if a value looks like a string table offset (typically < 4096)"""
     return 0 < value < 4096
@@ -21,8 +60,8 @@ class TimestampRecord:
     def __str__(self):
         ts_32bit = self.timestamp_val & 0xFFFFFFFF
         try:
-            date_str = datetime.datetime.utcfromtimestamp(ts_32bit).strftime('%Y-%m-%d %H:%M:%S UTC')
-        except (ValueError, OSError):
+            date_str = format_utc_timestamp(ts_32bit)
+        except (ValueError, OSError, OverflowError):
             date_str = "Invalid Date"
         return f"Timestamp: {format_int(ts_32bit)} = {date_str}"
 
@@ -107,7 +146,7 @@ class NetUpdateRecord:
             padding = len(data) % 4
             if padding != 0:
                 data += b'\x00' * (4 - padding)
-            int_array = [struct.unpack_from('<I', data, i)[0] for i in range(0, len(data), 4)]
+            int_array = [v for (v,) in _U32.iter_unpack(data)]
             i = 0
             while i < len(int_array):
                 num = int_array[i]
@@ -172,7 +211,7 @@ class GenericRecord:
         padding = len(data) % 4
         if padding != 0: data += b'\x00' * (4 - padding)
         if not data: return " ".join(header_parts)
-        int_array = [struct.unpack_from('<I', data, i)[0] for i in range(0, len(data), 4)]
+        int_array = [v for (v,) in _U32.iter_unpack(data)]
         summary_lines = []
         i = 0
         while i < len(int_array):
@@ -204,8 +243,8 @@ def _generate_diff(expected: bytes, actual: bytes) -> List[str]:
         if exp_chunk != act_chunk:
             diff_lines.extend([
                 f"    {i:04x}:",
-                f"      - Expected: {' '.join(f'{b:02x}' for b in exp_chunk)}",
-                f"      - Actual:   {' '.join(f'{b:02x}' for b in act_chunk)}"
+                f"      - Expected: {exp_chunk.hex(' ')}",
+                f"      - Actual:   {act_chunk.hex(' ')}"
             ])
     return diff_lines
 
@@ -235,7 +274,7 @@ class UnknownStruct60Byte:
                 payload_ints_str = ", ".join(payload_ints)
             else:
                 # Show as hex bytes if not 4-byte aligned
-                payload_ints_str = " ".join(f"{b:02x}" for b in self.payload)
+                payload_ints_str = self.payload.hex(' ')
         
         lines.append(f"  - Payload: {len(self.payload)} bytes")
         lines.append(f"    Values: [{payload_ints_str}]")
@@ -247,7 +286,7 @@ class UnknownStruct60Byte:
             if len(self.trailing_separator) >= 16 and self.trailing_separator.startswith(b'\xff\xff\xff\xff'):
                 lines.append(f"    Contains 0xffffffff marker before separator")
             # Show the actual separator bytes
-            sep_hex = " ".join(f"{b:02x}" for b in self.trailing_separator)
+            sep_hex = self.trailing_separator.hex(' ')
             lines.append(f"    Bytes: {sep_hex}")
         else:
             lines.append(f"  - Trailing: {len(self.trailing_separator)} bytes (UNEXPECTED)")
@@ -297,10 +336,10 @@ class ComponentPropertyRecord:
         if len(self.data) != 132:
             raise ValueError(f"ComponentPropertyRecord expects 132 bytes, got {len(self.data)}")
         
-        self.structure_id = struct.unpack_from('<Q', self.data, 0)[0]
+        self.structure_id = _U64.unpack_from(self.data, 0)[0]
         self.config_and_pointers = self.data[8:96]
         self.padding = self.data[96:128]
-        self.value_id = struct.unpack_from('<I', self.data, 128)[0]
+        self.value_id = _U32.unpack_from(self.data, 128)[0]
         self.config_matches = (self.config_and_pointers == self.EXPECTED_CONFIG)
         self.padding_matches = (self.padding == self.EXPECTED_PADDING)
 
@@ -332,6 +371,7 @@ class HypothesisParser:
         self.string_table_data = string_table_data
         self.filepath = filepath
         self.strings = []
+        self.string_offsets = {}
         self.curator = BinaryCurator(self.data)
         if string_table_data:
             self._parse_string_table()
@@ -354,9 +394,9 @@ class HypothesisParser:
                     pos, val = sep_info
                     if (val & 0xFFFFFFFF) > 946684800:
                         try:
-                            datetime.datetime.utcfromtimestamp(val & 0xFFFFFFFF)
+                            time.gmtime(val & 0xFFFFFFFF)
                             timestamp_offset, timestamp_val = pos, val
-                        except (ValueError, OSError): pass
+                        except (ValueError, OSError, OverflowError): pass
             return self._parse_pointer_driven(header, header_end, timestamp_offset, timestamp_val)
         except ValueError:
             # Re-raise ValueError (including overlap detection errors) to caller
@@ -364,10 +404,11 @@ class HypothesisParser:
 
     def _parse_header_with_curator(self) -> int:
         if len(self.data) < 16: return 0
-        header_id = struct.unpack_from('<I', self.data, 0)[0]
-        end_offset = struct.unpack_from('<I', self.data, 8)[0]
+        header_id = _U32.unpack_from(self.data, 0)[0]
+        end_offset = _U32.unpack_from(self.data, 8)[0]
         if end_offset > len(self.data) or end_offset < 8: return 0
-        all_fields = [struct.unpack_from('<Q', self.data, i)[0] for i in range(8, end_offset, 8)]
+        # One cached unpack for every 64-bit field that starts before end_offset
+        all_fields = list(u64_struct((end_offset - 1) // 8).unpack_from(self.data, 8))
         self.curator.claim("Table Header", end_offset, lambda d: TableHeader(header_id=header_id, pointer_list_end_offset=end_offset, first_record_offset=all_fields[0] if all_fields else 0, unknown_offsets_1_30=all_fields[1:31] if len(all_fields) > 31 else [], boundary_offsets_31_33=all_fields[31:34] if len(all_fields) > 33 else [], config_values=all_fields[34:] if len(all_fields) > 34 else [], raw_all_fields=all_fields))
         return end_offset
 
@@ -416,9 +457,9 @@ class HypothesisParser:
                 if size > 16: self._claim_record_segment(offset + 16, size - 16)
                 return
         if size >= 12:
-            t = struct.unpack_from('<I', self.data, offset)[0]
+            t = _U32.unpack_from(self.data, offset)[0]
             if t == 19 and len(self.data[offset:]) >= 12:
-                s1, s2 = struct.unpack_from('<II', self.data, offset + 4)
+                s1, s2 = _U32_PAIR.unpack_from(self.data, offset + 4)
                 if s1 == s2 and s1 > 0 and (12 + s1) <= size:
                     net_size = self._try_claim_net_update(offset)
                     if net_size > 0:
@@ -535,7 +576,7 @@ class HypothesisParser:
         data_end = separator_pos
         
         if separator_pos >= 4:
-            possible_marker = struct.unpack('<I', record_data[separator_pos-4:separator_pos])[0]
+            possible_marker = _U32.unpack_from(record_data, separator_pos - 4)[0]
             if possible_marker == 0xffffffff:
                 has_separator_marker = True
                 data_end = separator_pos - 4
@@ -573,7 +614,7 @@ class HypothesisParser:
 
     def _check_property_value(self, data: bytes) -> Optional[dict]:
         if len(data) < 32: return None
-        record_type, marker, _, _, _, _, _, val_at_index_7 = struct.unpack_from('<IIIIIIII', data, 0)
+        record_type, marker, _, _, _, _, _, val_at_index_7 = _PROPERTY_VALUE_HEAD.unpack_from(data, 0)
         if record_type == 19 and marker == 0xc8000000 and 20 < val_at_index_7 < 200:
             unclaimed_bytes = data[32:] if len(data) > 32 else b''
             return {
@@ -595,8 +636,9 @@ class HypothesisParser:
     def _find_string_refs_in_data(self, data: bytes) -> List[tuple]:
         if not self.string_table_data: return []
         refs = []
-        for offset in range(0, len(data) - 1, 2):
-            val = struct.unpack_from('<H', data, offset)[0]
+        words = _U16.iter_unpack(data[:len(data) & ~1])
+        for index, (val,) in enumerate(words):
+            offset = index * 2
             if 100 < val < 2048:
                 resolved = self._lookup_string(val)
                 if resolved and len(resolved) > 1: refs.append((offset, val, resolved))
@@ -604,32 +646,26 @@ class HypothesisParser:
 
     def _parse_string_table(self):
         if len(self.string_table_data) < 20: return
-        pos = 20
-        while pos < len(self.string_table_data):
-            end = self.string_table_data.find(b'\x00', pos)
-            if end == -1: break
-            try: self.strings.append((pos - 20, self.string_table_data[pos:end].decode('utf-8')))
-            except UnicodeDecodeError: pass
-            pos = end + 1
+        # The cache key must be hashable, so bytearray or memoryview input is
+        # converted once up front
+        strings, self.string_offsets = parse_string_entries(bytes(self.string_table_data))
+        self.strings = list(strings)
 
     def _lookup_string(self, offset):
-        return next(
-            (
-                string
-                for str_offset, string in self.strings
-                if str_offset in [offset, offset - 1]
-            ),
-            None,
-        )
+        # offset - 1 precedes offset in the table, so it wins when both exist
+        string = self.string_offsets.get(offset - 1)
+        if string is None:
+            string = self.string_offsets.get(offset)
+        return string
 
     def _parse_legacy_fallback(self, header_end: int, timestamp_offset: Optional[int] = None, timestamp_val: Optional[int] = None) -> List[Region]:
         return self.curator.get_regions() # Simplified for brevity
 
     def _check_separator(self, cursor):
         if cursor + 16 > len(self.data): return None
-        marker = struct.unpack_from('<I', self.data, cursor)[0]
+        marker = _U32.unpack_from(self.data, cursor)[0]
         if marker != 0xffffffff: return None
-        return (cursor, struct.unpack_from('<Q', self.data, cursor + 8)[0])
+        return (cursor, _U64.unpack_from(self.data, cursor + 8)[0])
 
     def _try_claim_net_update(self, cursor) -> int: return 0
     def _try_claim_padding(self, cursor) -> int: return 0
\ No newline at end of file
@@ -224,6 +224,38 @@ def test_overlap_detection():
     print("\n✓ PASSED: Overlap detection works correctly")
     return True
 
+def test_overlap_detection_random():
+    """Test the sorted overlap check against a brute-force scan, including zero-size claims"""
+    print("\n" + "="*70)
+    print("TEST 7: Randomized Overlap Detection")
+    print("="*70)
+    
+    import random
+    rng = random.Random(7)
+    for _ in range(500):
+        curator = BinaryCurator(bytes(64))
+        claimed = []
+        for _ in range(24):
+            start, size = rng.randint(0, 60), rng.choice([0, 1, 2, 3, 5, 8])
+            if start + size > 64:
+                continue
+            expected = any(not (start + size <= s or start >= e) for s, e in claimed)
+            curator.seek(start)
+            try:
+                curator.claim("Region", size, lambda b: f"{len(b)} bytes")
+                detected = False
+            except ValueError:
+                detected = True
+            if detected != expected:
+                print(f"\n✗ FAILED: claim {start}+{size} over {claimed}: detected={detected}")
+                return False
+            if not detected:
+                claimed.append((start, start + size))
+    
+    print("✓ 500 random claim sequences agree with a brute-force scan")
+    print("\n✓ PASSED: Randomized overlap detection works correctly")
+    return True
+
 def main():
     print("\nBinaryCurator Test Suite")
     print("="*70)
@@ -235,6 +267,7 @@ def main():
     results.append(("Full Claim", test_full_claim()))
     results.append(("Out-of-Order Claims", test_out_of_order_claims()))
     results.append(("Overlap Detection", test_overlap_detection()))
+    results.append(("Randomized Overlap Detection", test_overlap_detection_random()))
     
     print("\n" + "="*70)
     print("TEST SUMMARY")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Test suite for the byte-level diff in tools/oa_diff2.py
+
+Tests:
+1. Opcodes from binary_diff() cover both inputs contiguously
+   and binary_diff_opcodes() reports the same runs as plain offsets
+2. myers_diff() finds a minimal edit script (checked against a plain LCS)
+3. myers_diff() gives up past max_edits, and binary_diff_opcodes() then
+   falls back to SequenceMatcher within a budget scaled to the input
+4. _equal_tail() measures the common suffix up to its limit
+"""
+
+import sys
+import os
+# Add parent and tools directories to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tools'))
+
+import random
+from difflib import SequenceMatcher
+from oa_diff2 import binary_diff, binary_diff_opcodes, myers_diff, myers_edit_budget, _equal_tail
+
+CASES = [
+    (b'', b''),
+    (b'abc', b'abc'),
+    (b'', b'xyz'),
+    (b'xyz', b''),
+    (b'abc', b'xyz'),
+    (b'R0 2K\x00R1 2K\x00', b'R0 2K\x00R1 3K\x00'),
+    (b'\x00' * 32 + b'\x7c\x00', b'\x00' * 32 + b'\x7e\x00\x00\x00'),
+]
+
+
+def random_cases(count, seed=1):
+    """Small byte strings with a few random inserts, deletes and overwrites."""
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(count):
+        a = bytes(rng.choice(b'ab\x00') for _ in range(rng.randint(0, 24)))
+        b = bytearray(a)
+        for _ in range(rng.randint(0, 5)):
+            pos = rng.randint(0, len(b))
+            op = rng.random()
+            if op < 0.3:
+                b[pos:pos] = bytes(rng.choice(b'abc') for _ in range(rng.randint(1, 3)))
+            elif op < 0.6:
+                del b[pos:pos + rng.randint(1, 3)]
+            elif b:
+                b[min(pos, len(b) - 1)] = rng.choice(b'abc')
+        cases.append((a, bytes(b)))
+    return cases
+
+
+def lcs_length(a, b):
+    """Length of the longest common subsequence, by dynamic programming."""
+    prev = [0] * (len(b) + 1)
+    for x in a:
+        cur = [0]
+        for j, y in enumerate(b):
+            cur.append(prev[j] + 1 if x == y else max(prev[j + 1], cur[j]))
+        prev = cur
+    return prev[-1]
+
+
+def test_binary_diff_covers_inputs():
+    """Test that the diff reconstructs both inputs and equal runs really match."""
+    print("="*70)
+    print("TEST 1: binary_diff Reconstruction")
+    print("="*70)
+
+    for a, b in CASES + random_cases(500):
+        differences = binary_diff(a, b)
+        assert b''.join(d[3] for d in differences) == a
+        assert b''.join(d[4] for d in differences) == b
+        pos = 0
+        for tag, i1, i2, bytes1, bytes2 in differences:
+            assert i1 == pos
+            pos = i2
+            if tag == 'equal':
+                assert bytes1 == bytes2
+        assert pos == len(a)
+        opcodes = binary_diff_opcodes(a, b)
+        assert [(tag, a[i1:i2], b[j1:j2]) for tag, i1, i2, j1, j2 in opcodes] == \
+               [(tag, bytes(b1), bytes(b2)) for tag, i1, i2, b1, b2 in differences]
+    print(f"  ✓ {len(CASES) + 500} input pairs reconstructed")
+
+
+def test_myers_is_minimal():
+    """Test that Myers keeps as many bytes equal as the LCS allows."""
+    print("\n" + "="*70)
+    print("TEST 2: Myers Minimal Edit Script")
+    print("="*70)
+
+    for a, b in CASES + random_cases(500, seed=2):
+        opcodes = myers_diff(a, b)
+        equal = 0
+        for tag, i1, i2, j1, j2 in opcodes:
+            if tag == 'equal':
+                assert a[i1:i2] == b[j1:j2]
+                equal += i2 - i1
+        assert equal == lcs_length(a, b)
+    print("  ✓ Equal byte count matches the LCS length")
+
+    # Long equal runs between a few insertions exercise the block-compare
+    # snake extension; every original byte must stay matched
+    rng = random.Random(3)
+    a = bytes(rng.getrandbits(8) for _ in range(1 << 16))
+    b = bytearray(a)
+    for pos in sorted(rng.sample(range(len(a)), 10), reverse=True):
+        b[pos:pos] = b'\xee\xff'
+    opcodes = myers_diff(a, bytes(b))
+    assert sum(i2 - i1 for tag, i1, i2, j1, j2 in opcodes if tag == 'equal') == len(a)
+    assert all(tag in ('equal', 'insert') for tag, i1, i2, j1, j2 in opcodes)
+    print("  ✓ 64 KiB input with 10 insertions diffed minimally")
+
+
+def test_myers_fallback():
+    """Test that Myers stops once the edit distance exceeds max_edits."""
+    print("\n" + "="*70)
+    print("TEST 3: Edit Limit Fallback")
+    print("="*70)
+
+    a, b = b'a' * 64, b'b' * 64
+    assert myers_diff(a, b, max_edits=8) is None
+    assert myers_diff(a, b) is not None
+    print("  ✓ Myers gives up past max_edits")
+
+    # Unrelated payloads exceed the scaled budget and get SequenceMatcher's opcodes
+    rng = random.Random(5)
+    a = bytes(rng.getrandbits(8) for _ in range(2048))
+    b = bytes(rng.getrandbits(8) for _ in range(2048))
+    assert myers_diff(a, b, myers_edit_budget(len(a) + len(b))) is None
+    assert binary_diff_opcodes(a, b) == SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+    assert myers_edit_budget(0) == 0 and max(myers_edit_budget(n) for n in range(1 << 14)) == 512
+    print("  ✓ Unrelated 2 KiB payloads fall back within the scaled budget")
+
+
+def test_equal_tail():
+    """Test the backwards gallop against a byte-by-byte suffix count."""
+    print("\n" + "="*70)
+    print("TEST 4: Common Suffix")
+    print("="*70)
+
+    rng = random.Random(4)
+    for _ in range(300):
+        tail = bytes(rng.getrandbits(8) for _ in range(rng.choice((0, 3, 64, 65, 1000))))
+        a = bytes(rng.getrandbits(8) for _ in range(rng.randint(0, 40))) + tail
+        b = bytes(rng.getrandbits(8) for _ in range(rng.randint(0, 40))) + tail
+        limit = rng.randint(0, min(len(a), len(b)))
+        expected = 0
+        while expected < limit and a[-1 - expected] == b[-1 - expected]:
+            expected += 1
+        assert _equal_tail(a, memoryview(b), limit) == expected
+    print("  ✓ 300 suffixes measured correctly")
+
+
+def main():
+    test_binary_diff_covers_inputs()
+    test_myers_is_minimal()
+    test_myers_fallback()
+    test_equal_tail()
+    print("\nALL TESTS PASSED ✓")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
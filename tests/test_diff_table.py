@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test suite for the table views and line diff in oaparser/hexdiff.py
+
+Tests:
+1. positional_unified_diff() matches difflib.unified_diff() on the hex-dump
+   and int32 views of every changed table between consecutive files, both on
+   prebuilt line lists and on raw TableRows formatted on demand
+2. Block-compared TableRows runs match a row-by-row diff on large payloads
+   with scattered edits and partial last rows
+3. TableRows follows the sequence protocol: iteration stops at the last
+   row and out-of-range indices raise IndexError
+"""
+
+import sys
+import os
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import difflib
+import random
+from oaparser import open_oa
+from oaparser.hexdiff import (get_hex_dump_lines, get_int32_view_lines, positional_unified_diff,
+                              hex_dump_line, int32_view_line, pad_to_words, TableRows)
+
+TEST_FILES = ['files/rc/sch_old.oa', 'files/rc/sch4.oa', 'files/rc/sch5.oa',
+              'files/rc/sch9.oa', 'files/rc/sch10.oa', 'files/rc/sch14.oa']
+
+
+def test_positional_diff_matches_difflib():
+    """Test that the positional diff prints exactly what unified_diff would."""
+    print("="*70)
+    print("TEST 1: Positional Line Diff")
+    print("="*70)
+
+    compared = 0
+    for file_old, file_new in zip(TEST_FILES, TEST_FILES[1:]):
+        oa_old, oa_new = open_oa(file_old), open_oa(file_new)
+        for table_id in sorted(oa_old.tables.keys() & oa_new.tables.keys()):
+            data_old, data_new = oa_old.read(table_id), oa_new.read(table_id)
+            if data_old == data_new:
+                continue
+            views = ((get_hex_dump_lines, hex_dump_line, 16, bytes),
+                     (get_int32_view_lines, int32_view_line, 4, pad_to_words))
+            for view, format_line, width, prepare in views:
+                lines_old, lines_new = view(data_old), view(data_new)
+                expected = list(difflib.unified_diff(lines_old, lines_new, n=1, lineterm=''))
+                assert list(positional_unified_diff(lines_old, lines_new, n=1)) == expected
+                assert list(positional_unified_diff(lines_old, lines_new, n=3)) == \
+                       list(difflib.unified_diff(lines_old, lines_new, n=3, lineterm=''))
+                rows_old = TableRows(prepare(data_old), width)
+                rows_new = TableRows(prepare(data_new), width)
+                assert list(positional_unified_diff(rows_old, rows_new, n=1,
+                                                    format_line=format_line)) == expected
+                compared += 1
+    print(f"  ✓ {compared} table views diffed identically")
+
+
+def test_long_equal_runs():
+    """Test that equal rows skipped in blocks give the same diff as single rows."""
+    print("\n" + "="*70)
+    print("TEST 2: Block-Compared Equal Runs")
+    print("="*70)
+
+    rng = random.Random(1)
+    for trial in range(50):
+        old = bytes(rng.getrandbits(8) for _ in range(rng.randint(0, 4096)))
+        new = bytearray(old)
+        for _ in range(rng.randint(0, 4)):
+            if new:
+                new[rng.randrange(len(new))] ^= 0xff
+        new = bytes(new[:len(new) - rng.randint(0, 20)] + b'\xaa' * rng.randint(0, 20))
+        expected = list(difflib.unified_diff(get_hex_dump_lines(old), get_hex_dump_lines(new),
+                                             n=3, lineterm=''))
+        rows_old, rows_new = TableRows(memoryview(old), 16), TableRows(new, 16)
+        assert list(positional_unified_diff(rows_old, rows_new, n=3,
+                                            format_line=hex_dump_line)) == expected
+    print("  ✓ 50 random payload pairs diffed identically")
+
+
+def test_table_rows_sequence():
+    """Test that TableRows iterates, indexes and bounds-checks like a sequence."""
+    print("\n" + "="*70)
+    print("TEST 3: TableRows Sequence Protocol")
+    print("="*70)
+
+    rows = TableRows(memoryview(b'abcdefghij'), 4)
+    assert list(rows) == [b'abcd', b'efgh', b'ij']
+    assert b'efgh' in rows and b'xyz' not in rows
+    assert rows[-1] == b'ij' and rows[-3] == b'abcd'
+    for index in (3, 5, -4):
+        try:
+            rows[index]
+        except IndexError:
+            continue
+        raise AssertionError(f"rows[{index}] did not raise IndexError")
+    assert list(TableRows(b'', 16)) == []
+    print("  ✓ iteration, membership and bounds checks behave like a sequence")
+
+
+def main():
+    test_positional_diff_matches_difflib()
+    test_long_equal_runs()
+    test_table_rows_sequence()
+    print("\nALL TESTS PASSED ✓")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test suite for the memory-mapped .oa file reader (oaparser.oa_file).
+
+Tests:
+1. The parsed table directory (and u64_array, unpack_directory) matches a plain
+   header/directory read
+2. Table payloads are returned as views (or bytes copies) matching f.read()
+3. Missing tables return None
+4. same_payload() compares table views by content
+5. file_digest() matches hashlib over the whole file
+"""
+
+import sys
+import os
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hashlib
+import struct
+from oaparser import (OaFileMap, TableEntry, open_oa, same_payload, file_digest, u64_array,
+                      unpack_directory)
+
+TEST_FILES = ['files/rc/sch_old.oa', 'files/rc/sch7.oa', 'files/rc/sch14.oa']
+
+
+def read_directory(filename):
+    """Reads the table directory the same way the tools always have."""
+    with open(filename, 'rb') as f:
+        header = f.read(24)
+        _, _, _, _, _, used = struct.unpack('<IHHQII', header)
+        ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
+        offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
+        sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
+    return ids, offsets, sizes
+
+
+def test_directory_matches():
+    """Test that every valid directory entry is present with the right location."""
+    print("="*70)
+    print("TEST 1: Table Directory")
+    print("="*70)
+
+    for filename in TEST_FILES:
+        ids, offsets, sizes = read_directory(filename)
+        oa = open_oa(filename)
+        assert isinstance(oa, OaFileMap)
+
+        expected = {ids[i]: (offsets[i], sizes[i])
+                    for i in range(len(ids)) if offsets[i] != 0xffffffffffffffff}
+        assert {tid: (entry.offset, entry.size) for tid, entry in oa.tables.items()} == expected
+        assert all(isinstance(entry, TableEntry) for entry in oa.tables.values())
+
+        with open(filename, 'rb') as f:
+            f.seek(24)
+            assert list(u64_array(f.read(8 * len(ids)))) == ids
+            f.seek(0)
+            raw = f.read(24 + 24 * len(ids))
+        columns = (tuple(ids), tuple(offsets), tuple(sizes))
+        assert unpack_directory(raw, len(ids)) == columns
+        assert unpack_directory(raw[24:], len(ids), 0) == columns
+        print(f"  ✓ {filename}: {len(oa.tables)} tables")
+
+
+def test_table_payloads():
+    """Test that table views hold exactly the bytes read from the file."""
+    print("\n" + "="*70)
+    print("TEST 2: Table Payloads")
+    print("="*70)
+
+    for filename in TEST_FILES:
+        ids, offsets, sizes = read_directory(filename)
+        with open(filename, 'rb') as f:
+            raw = f.read()
+
+        with open_oa(filename) as oa:
+            for table_id in (0x1, 0xa, 0xc):
+                i = ids.index(table_id)
+                view = oa.table(table_id)
+                assert isinstance(view, memoryview)
+                assert view == raw[offsets[i]:offsets[i] + sizes[i]]
+                view.release()
+                assert oa.read(table_id) == raw[offsets[i]:offsets[i] + sizes[i]]
+        print(f"  ✓ {filename}: Tables 0x1, 0xa, 0xc match")
+
+
+def test_missing_table():
+    """Test that an unknown table ID returns None."""
+    print("\n" + "="*70)
+    print("TEST 3: Missing Table")
+    print("="*70)
+
+    oa = open_oa(TEST_FILES[0])
+    assert oa.table(0xdeadbeef) is None
+    assert oa.read(0xdeadbeef) is None
+    print("  ✓ Unknown table ID returns None")
+
+
+def test_same_payload():
+    """Test payload comparison across files and chunk boundaries."""
+    print("\n" + "="*70)
+    print("TEST 4: Payload Comparison")
+    print("="*70)
+
+    oa9, oa10 = open_oa('files/rc/sch9.oa'), open_oa('files/rc/sch10.oa')
+    assert same_payload(oa9.table(0x1), oa9.table(0x1))
+    assert not same_payload(oa9.table(0xc), oa10.table(0xc))
+    assert not same_payload(oa9.table(0xc), oa9.table(0xa))
+    print("  ✓ sch9 vs sch10 Table 0xC differs")
+
+    big = bytes(3 << 20)
+    assert same_payload(big, bytearray(big))
+    assert not same_payload(big, big[:-1] + b'\x01')
+    print("  ✓ Multi-chunk payloads compared correctly")
+
+
+def test_file_digest():
+    """Test that whole-file digests match hashlib and tell files apart."""
+    print("\n" + "="*70)
+    print("TEST 5: File Digest")
+    print("="*70)
+
+    for filename in TEST_FILES:
+        with open(filename, 'rb') as f:
+            assert file_digest(filename) == hashlib.sha256(f.read()).digest()
+    assert file_digest('files/rc/sch9.oa') != file_digest('files/rc/sch10.oa')
+    print("  ✓ Digests match hashlib.sha256")
+
+
+def main():
+    test_directory_matches()
+    test_table_payloads()
+    test_missing_table()
+    test_same_payload()
+    test_file_digest()
+    print("\nALL TESTS PASSED ✓")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
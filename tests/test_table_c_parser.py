@@ -6,6 +6,8 @@ Tests:
 1. Timestamp extraction (regression test)
 2. Property value detection and parsing
 3. Comparison between known file pairs
+4. Component property record detection
+5. String tables given as bytes, bytearray or memoryview parse alike
 """
 
 import sys
@@ -248,6 +250,26 @@ def test_component_property_record_detection():
         traceback.print_exc()
         return False
 
+def test_string_table_input_types():
+    """Test that the string table parses the same for any bytes-like input."""
+    print("\n" + "="*70)
+    print("TEST 5: String Table Input Types")
+    print("="*70)
+
+    table = b'\0' * 20 + b'abc\0R0\0\0'
+    results = []
+    for string_table in (table, bytearray(table), memoryview(table)):
+        parser = HypothesisParser(b'\0' * 64, string_table)
+        parser._parse_string_table()
+        results.append((parser.strings, parser.string_offsets))
+
+    expected = ([(0, 'abc'), (4, 'R0'), (7, '')], {0: 'abc', 4: 'R0', 7: ''})
+    if all(result == expected for result in results):
+        print("  ✓ bytes, bytearray and memoryview string tables parse identically")
+        return True
+    print(f"  ✗ Unexpected string table results: {results}")
+    return False
+
 def main():
     print("\nTable 0xC Parser Test Suite")
     print("="*70)
@@ -257,6 +279,7 @@ def main():
     results.append(("Strict Property Value Detection", test_property_value_detection()))
     results.append(("Generic Record String Change", test_generic_record_string_change()))
     results.append(("Component Property Record Detection", test_component_property_record_detection()))
+    results.append(("String Table Input Types", test_string_table_input_types()))
     
     print("\n" + "="*70)
     print("TEST SUMMARY")
@@ -11,35 +11,26 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import struct
+from oaparser import ClaimedRegion, open_oa, file_digest
 from parsers.table_c_parser import HypothesisParser, PropertyValueRecord
 
 def extract_table_c(filename):
     """Extract Table 0xC data from an .oa file."""
-    with open(filename, 'rb') as f:
-        header = f.read(24)
-        _, _, _, _, _, used = struct.unpack('<IHHQII', header)
-        ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-        offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-        sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-        
-        for i in range(used):
-            if ids[i] == 0x0c:
-                f.seek(offsets[i])
-                return f.read(sizes[i])
-    return None
+    view = open_oa(filename).table(0x0c)
+    return bytes(view) if view is not None else None
 
 def extract_property_values(filename):
-    """Extract all property value IDs from a file's Table 0xC."""
+    """Extract all property value IDs from a file's Table 0xC, sorted by offset."""
     data = extract_table_c(filename)
     if not data:
         return []
     
     parser = HypothesisParser(data)
-    parser.parse()
+    regions = parser.parse()
     
     property_values = []
-    for record in parser.records:
+    for region in regions:
+        record = region.parsed_value if isinstance(region, ClaimedRegion) else None
         if isinstance(record, PropertyValueRecord):
             property_values.append({
                 'offset': record.offset,
@@ -47,13 +38,43 @@ def extract_property_values(filename):
                 'size': record.size
             })
     
+    property_values.sort(key=lambda pv: pv['offset'])
     return property_values
 
+def merge_by_offset(pv1, pv2):
+    """
+    Walk two offset-sorted record lists together in a single pass.
+
+    Yields (offset, old_value_id, new_value_id), with None on the side where
+    the offset has no record.
+    """
+    i, j = 0, 0
+    n1, n2 = len(pv1), len(pv2)
+    while i < n1 or j < n2:
+        off1 = pv1[i]['offset'] if i < n1 else None
+        off2 = pv2[j]['offset'] if j < n2 else None
+        if off2 is None or (off1 is not None and off1 < off2):
+            yield off1, pv1[i]['value_id'], None
+            i += 1
+        elif off1 is None or off2 < off1:
+            yield off2, None, pv2[j]['value_id']
+            j += 1
+        else:
+            yield off1, pv1[i]['value_id'], pv2[j]['value_id']
+            i += 1
+            j += 1
+
 def compare_files(file1, file2):
     """Compare property values between two files."""
     print(f"Comparing {file1} (OLD) with {file2} (NEW)")
     print("="*70)
     
+    # Byte-identical files cannot have property value changes
+    if file_digest(file1) == file_digest(file2):
+        print("\nFiles are identical; no property value changes.")
+        print("\n" + "="*70)
+        return
+    
     pv1 = extract_property_values(file1)
     pv2 = extract_property_values(file2)
     
@@ -65,18 +86,9 @@ def compare_files(file1, file2):
     print("Property Value Changes by Offset:")
     print("="*70)
     
-    # Create dictionaries keyed by offset
-    pv1_dict = {pv['offset']: pv for pv in pv1}
-    pv2_dict = {pv['offset']: pv for pv in pv2}
-    
-    # Find all offsets
-    all_offsets = sorted(set(pv1_dict.keys()) | set(pv2_dict.keys()))
-    
+    # Both lists are sorted by offset, so one merge pass pairs them up
     changes_found = False
-    for offset in all_offsets:
-        old_val = pv1_dict.get(offset, {}).get('value_id', None)
-        new_val = pv2_dict.get(offset, {}).get('value_id', None)
-        
+    for offset, old_val, new_val in merge_by_offset(pv1, pv2):
         if old_val is None and new_val is not None:
             print(f"\nOffset 0x{offset:04x}: [ADDED] -> Property Value ID {new_val}")
             changes_found = True
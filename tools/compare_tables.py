@@ -7,35 +7,24 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import struct
+from oaparser import open_oa, same_payload
 from parsers.table_a_parser import TableAParser
 
 def read_oa_file(filepath):
     """Read .oa file and return table information"""
-    tables = {}
+    oa = open_oa(filepath)
     
-    with open(filepath, 'rb') as f:
-        # Read header
-        header = f.read(24)
-        _, _, _, _, _, used = struct.unpack('<IHHQII', header)
-        
-        # Read table directory
-        ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-        offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-        sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-        
-        # Store table info
-        for i in range(used):
-            if offsets[i] != 0xffffffffffffffff and sizes[i] > 0:
-                f.seek(offsets[i])
-                data = f.read(sizes[i])
-                tables[ids[i]] = {
-                    'offset': offsets[i],
-                    'size': sizes[i],
-                    'data': data
-                }
-    
-    return tables
+    # Table payloads stay as views into the mapped file; the directory
+    # is parsed once by open_oa()
+    return {
+        table_id: {
+            'offset': entry.offset,
+            'size': entry.size,
+            'data': oa.table(table_id)
+        }
+        for table_id, entry in oa.tables.items()
+        if entry.size > 0
+    }
 
 def compare_tables(file1, file2):
     """Compare tables between two .oa files"""
@@ -44,7 +33,9 @@ def compare_tables(file1, file2):
     tables1 = read_oa_file(file1)
     tables2 = read_oa_file(file2)
     
-    all_table_ids = sorted(set(tables1.keys()) | set(tables2.keys()))
+    # dict key views support set operations directly; compute each once
+    keys1, keys2 = tables1.keys(), tables2.keys()
+    all_table_ids = sorted(keys1 | keys2)
     
     print(f"Total unique tables: {len(all_table_ids)}")
     print(f"Tables in {file1}: {len(tables1)}")
@@ -52,8 +43,8 @@ def compare_tables(file1, file2):
     print()
     
     # Find tables that only exist in one file
-    only_in_1 = set(tables1.keys()) - set(tables2.keys())
-    only_in_2 = set(tables2.keys()) - set(tables1.keys())
+    only_in_1 = keys1 - keys2
+    only_in_2 = keys2 - keys1
     
     if only_in_1:
         print(f"Tables only in {file1}:")
@@ -71,11 +62,11 @@ def compare_tables(file1, file2):
     changed_tables = []
     unchanged_tables = []
     
-    for tid in sorted(set(tables1.keys()) & set(tables2.keys())):
+    for tid in sorted(keys1 & keys2):
         t1 = tables1[tid]
         t2 = tables2[tid]
         
-        if t1['data'] != t2['data']:
+        if not same_payload(t1['data'], t2['data']):
             changed_tables.append({
                 'id': tid,
                 'size1': t1['size'],
@@ -103,18 +94,18 @@ def compare_tables(file1, file2):
 
             # If this is the string table, show the added strings
             if tid == 0xa:
-                parser1 = TableAParser(tables1[tid]['data'])
+                parser1 = TableAParser(bytes(tables1[tid]['data']))
                 parser1.parse()
                 strings1 = {s['string'] for s in parser1.strings}
 
-                parser2 = TableAParser(tables2[tid]['data'])
+                parser2 = TableAParser(bytes(tables2[tid]['data']))
                 parser2.parse()
                 strings2 = {s['string'] for s in parser2.strings}
 
                 added_strings = strings2 - strings1
                 if added_strings:
                     print(f"    {'':<12} {'Added strings:'}")
-                    for s in sorted(list(added_strings))[:5]: # Show first 5
+                    for s in sorted(added_strings)[:5]: # Show first 5
                         print(f"    {'':<14} - \"{s}\"")
 
     return changed_tables, unchanged_tables
@@ -1,69 +1,46 @@
 import sys
-import struct
 import os
-import difflib
-
-# --- Helper function for clean hex dumps ---
-def get_hex_dump_lines(data):
-    """Creates a complete, formatted hex dump of a byte string as a list of lines."""
-    lines = []
-    for i in range(0, len(data), 16):
-        chunk = data[i:i+16]
-        hex_part = ' '.join(f'{b:02x}' for b in chunk)
-        ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
-        lines.append(f"{i:08x}: {hex_part:<48} |{ascii_part}|")
-    return lines
-
-# --- Helper function for uint32_t array view ---
-def get_int32_view_lines(data):
-    """
-    Parses a byte array as a flat list of 32-bit unsigned little-endian integers
-    and returns the view as a list of formatted strings.
-    """
-    lines = []
-    # Ensure data is padded to be a multiple of 4 bytes for a clean array view
-    padding = len(data) % 4
-    if padding != 0:
-        data += b'\x00' * (4 - padding)
-
-    num_integers = len(data) // 4
-    for i in range(num_integers):
-        offset = i * 4
-        chunk = data[offset:offset+4]
-        value = struct.unpack('<I', chunk)[0]
-        hex_bytes_str = chunk.hex(' ')
-        lines.append(f"Index {i:04d} | Offset 0x{offset:04x}:  {hex_bytes_str:<12} ->  Value: {value} (0x{value:x})")
-    return lines
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import itertools
+
+from oaparser import open_oa
+from oaparser.hexdiff import (TableRows, get_hex_dump_lines, hex_dump_line, int32_view_line,
+                              pad_to_words, positional_unified_diff)
 
 class OaTableExtractor:
-    """A helper class to parse an OA file and extract a single table's data."""
+    """A helper class to parse an OA file once and extract tables' data from it."""
     def __init__(self, filepath):
         self.filepath = filepath
-
-    def get_table_data(self, table_id_hex):
-        """Finds and returns the raw byte data for a given table ID."""
-        table_id = int(table_id_hex, 16)
+        # Map the file and parse its directory once; every table lookup
+        # afterwards is a dict lookup on the same mapping
         try:
-            with open(self.filepath, 'rb') as f:
-                header = f.read(24)
-                _, _, _, _, _, used = struct.unpack('<IHHQII', header)
-
-                ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-                offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-                sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-
-                for i in range(used):
-                    if ids[i] == table_id:
-                        if offsets[i] == 0xffffffffffffffff:
-                            return None
-                        f.seek(offsets[i])
-                        return f.read(sizes[i])
+            self.oa = open_oa(filepath)
         except FileNotFoundError:
-            return None # Gracefully handle missing files
+            self.oa = None # Gracefully handle missing files
         except Exception as e:
             print(f"An error occurred while parsing {self.filepath}: {e}", file=sys.stderr)
+            self.oa = None
+
+    def get_table_data(self, table_id_hex):
+        """Finds and returns the raw byte data for a given table ID."""
+        if self.oa is None:
             return None
-        return None
+        # Inactive tables (invalid offset) are left out by open_oa(),
+        # so read() returns None for them
+        return self.oa.read(int(table_id_hex, 16))
+
+# filepath -> OaTableExtractor, so a file used by both the diff and the
+# full dump is only mapped and parsed once
+EXTRACTORS = {}
+
+def get_extractor(filepath):
+    """Returns the OaTableExtractor for a file, creating it on first use."""
+    extractor = EXTRACTORS.get(filepath)
+    if extractor is None:
+        extractor = EXTRACTORS[filepath] = OaTableExtractor(filepath)
+    return extractor
 
 def diff_specific_table(table_id_hex, file_old, file_new):
     """
@@ -76,8 +53,8 @@ def diff_specific_table(table_id_hex, file_old, file_new):
     print("#"*80 + "\n")
 
     try:
-        extractor_old = OaTableExtractor(file_old)
-        extractor_new = OaTableExtractor(file_new)
+        extractor_old = get_extractor(file_old)
+        extractor_new = get_extractor(file_new)
 
         data_old = extractor_old.get_table_data(table_id_hex)
         data_new = extractor_new.get_table_data(table_id_hex)
@@ -95,19 +72,20 @@ def diff_specific_table(table_id_hex, file_old, file_new):
 
         # --- 1. Hex Dump Diff ---
         print("-" * 32 + " Hex Dump Diff " + "-" * 31)
-        hex_lines_old = get_hex_dump_lines(data_old)
-        hex_lines_new = get_hex_dump_lines(data_new)
-        hex_diff = list(difflib.unified_diff(hex_lines_old, hex_lines_new, n=1, lineterm=''))
-        for line in hex_diff[3:]: # Skip header lines
+        # Each view line is fully determined by its raw row, so rows are
+        # compared as bytes and only lines inside a hunk are formatted
+        hex_diff = positional_unified_diff(TableRows(data_old, 16), TableRows(data_new, 16),
+                                           n=1, format_line=hex_dump_line)
+        for line in itertools.islice(hex_diff, 3, None): # Skip header lines
             print(line)
         print("-" * 80 + "\n")
 
         # --- 2. uint32_t Array Diff ---
         print("-" * 29 + " uint32_t Array Diff " + "-" * 29)
-        int_lines_old = get_int32_view_lines(data_old)
-        int_lines_new = get_int32_view_lines(data_new)
-        int_diff = list(difflib.unified_diff(int_lines_old, int_lines_new, n=1, lineterm=''))
-        for line in int_diff[3:]: # Skip header lines
+        int_diff = positional_unified_diff(TableRows(pad_to_words(data_old), 4),
+                                           TableRows(pad_to_words(data_new), 4),
+                                           n=1, format_line=int32_view_line)
+        for line in itertools.islice(int_diff, 3, None): # Skip header lines
             print(line)
         print("-" * 80)
 
@@ -124,7 +102,7 @@ def dump_specific_table(filepath, table_id_hex):
     print("#"*80 + "\n")
 
     try:
-        extractor = OaTableExtractor(filepath)
+        extractor = get_extractor(filepath)
         data = extractor.get_table_data(table_id_hex)
 
         if data is None:
@@ -1,5 +1,9 @@
-import struct
 import sys
+import os
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oaparser import open_oa
 
 def dump_string_table(filepath):
     """
@@ -7,38 +11,23 @@ def dump_string_table(filepath):
     """
     print(f"--- Dumping String Table (0xa) for: {filepath} ---\n")
     try:
-        with open(filepath, 'rb') as f:
-            # 1. Read the 24-byte preface to find the table directory size
-            header = f.read(24)
-            _, _, _, _, _, used = struct.unpack('<IHHQII', header)
-
-            if used == 0:
+        with open_oa(filepath) as oa:
+            # 1. Memory-map the file; open_oa() parses the 24-byte preface
+            # and the table directory
+            if not oa.tables:
                 print("No tables found in the directory.")
                 return
 
-            # 2. Read the entire table directory to find Table 0xa
-            ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
+            # 2. Look up Table 0xa in the directory and copy it out
+            string_table = oa.read(0xa)
 
-            string_table_info = None
-            for i in range(used):
-                if ids[i] == 0xa:
-                    string_table_info = {'offset': offsets[i], 'size': sizes[i]}
-                    break
-
-            if not string_table_info:
+            if string_table is None:
                 print("ERROR: String Table (ID 0xa) not found in the file.")
                 return
 
-            # 3. Seek to the string table and read its contents
-            f.seek(string_table_info['offset'])
-            
-            # The string table has a 20-byte header of its own we need to skip
+            # 3. The string table has a 20-byte header of its own we need to skip
             # (4x 4-byte integers for table_info + 4 bytes of padding)
-            table_header = f.read(20)
-            
-            string_buffer = f.read(string_table_info['size'] - 20)
+            string_buffer = string_table[20:]
 
             # 4. Iterate through the buffer and print null-terminated strings
             current_offset = 0
@@ -46,30 +35,19 @@ def dump_string_table(filepath):
             print(f"{'Index':<10} {'Offset (Hex)':<15} {'String'}")
             print("="*60)
 
-            while current_offset < len(string_buffer):
-                # Find the next null terminator
-                try:
-                    null_pos = string_buffer.index(b'\0', current_offset)
-                except ValueError:
-                    # No more null terminators
-                    break
-
-                # Decode the string
-                string_data = string_buffer[current_offset:null_pos]
-                
+            # One split walks the buffer once; the last piece has no null
+            # terminator and is dropped
+            for string_data in string_buffer.split(b'\0')[:-1]:
                 # Some offsets might be empty strings due to alignment/padding
-                if not string_data:
-                    current_offset = null_pos + 1
-                    continue
-                
-                try:
-                    decoded_string = string_data.decode('utf-8')
-                    print(f"{string_index:<10} 0x{current_offset:<12x} '{decoded_string}'")
-                except UnicodeDecodeError:
-                    print(f"{string_index:<10} 0x{current_offset:<12x} [DECODE ERROR: {string_data!r}]")
+                if string_data:
+                    try:
+                        decoded_string = string_data.decode('utf-8')
+                        print(f"{string_index:<10} 0x{current_offset:<12x} '{decoded_string}'")
+                    except UnicodeDecodeError:
+                        print(f"{string_index:<10} 0x{current_offset:<12x} [DECODE ERROR: {string_data!r}]")
+                    string_index += 1
 
-                string_index += 1
-                current_offset = null_pos + 1
+                current_offset += len(string_data) + 1
 
 
     except FileNotFoundError:
@@ -1,18 +1,18 @@
+import sys
 import os
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import glob
+import mmap
 import struct
 import difflib
 
-# --- Helper Functions ---
-def hex_dump(data):
-    """Creates a formatted hex dump of a byte string, similar to xxd."""
-    lines = []
-    for i in range(0, len(data), 16):
-        chunk = data[i:i+16]
-        hex_part = ' '.join(f'{b:02x}' for b in chunk)
-        ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
-        lines.append(f"{i:08x}: {hex_part:<48} |{ascii_part}|")
-    return lines
+from oaparser import HEADER, INVALID_OFFSET, same_payload, unpack_directory
+from oaparser.hexdiff import TableRows, hex_dump_line, positional_unified_diff
+
+# Save counter stored as a uint32 at offset 0x64 of Table 0x1
+SAVE_COUNTER = struct.Struct('<I')
 
 # --- Core Parser Class ---
 class ParsedOaFile:
@@ -24,119 +24,135 @@ class ParsedOaFile:
         self.filepath = filepath
         self.filename = os.path.basename(filepath)
         self.table_metadata = {} # id -> {offset, size}
-        self.table_data = {}     # id -> raw_bytes
+        self.table_data = {}     # id -> memoryview of the table's bytes
         self.strings = []
         self.save_counter = -1
+        self._mm = None
 
         try:
             self._parse()
         except Exception as e:
             print(f"[ERROR] Failed to parse {self.filepath}: {e}")
 
+        # Fixed once parsed; each file is diffed against both neighbours
+        self.table_ids = frozenset(self.table_metadata)
+
     def _parse(self):
-        """Parses the .oa file and loads all table data into memory."""
+        """
+        Parses the .oa file. The file stays mapped, and each table's data is
+        a zero-copy memoryview of the mapping until close() is called.
+        """
         with open(self.filepath, 'rb') as f:
-            header = f.read(24)
-            _, _, _, _, _, used = struct.unpack('<IHHQII', header)
-
-            ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-
-            for i in range(used):
-                self.table_metadata[ids[i]] = {'offset': offsets[i], 'size': sizes[i]}
-                if offsets[i] != 0xffffffffffffffff and sizes[i] > 0:
-                    f.seek(offsets[i])
-                    self.table_data[ids[i]] = f.read(sizes[i])
-
-            if 0xa in self.table_data:
-                string_heap = self.table_data[0xa][16:]
-                current_offset = 0
-                while current_offset < len(string_heap):
-                    try:
-                        null_pos = string_heap.index(b'\0', current_offset)
-                        string_data = string_heap[current_offset:null_pos]
-                        if string_data:
-                            self.strings.append(string_data.decode('utf-8', 'ignore'))
-                        current_offset = null_pos + 1
-                    except ValueError:
-                        break
-
-            if 0x1 in self.table_data and len(self.table_data[0x1]) >= 0x64 + 4:
-                self.save_counter = struct.unpack_from('<I', self.table_data[0x1], 0x64)[0]
+            self._mm = mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        _, _, _, _, _, used = HEADER.unpack_from(mm, 0)
+
+        ids, offsets, sizes = unpack_directory(mm, used)
+
+        for table_id, offset, size in zip(ids, offsets, sizes):
+            self.table_metadata[table_id] = {'offset': offset, 'size': size}
+            if offset != INVALID_OFFSET and size > 0:
+                self.table_data[table_id] = memoryview(mm)[offset:offset + size]
+
+        if 0xa in self.table_data:
+            string_heap = self.table_data[0xa][16:].tobytes()
+            # One split finds every null-terminated slot; the last piece
+            # follows the final null byte and is not a complete string.
+            # Each non-empty slot gives exactly one entry, even if nothing
+            # in it decodes, so entries keep their position in the heap.
+            self.strings = [raw.decode('utf-8', 'ignore')
+                            for raw in string_heap.split(b'\0')[:-1] if raw]
+
+        if 0x1 in self.table_data and len(self.table_data[0x1]) >= 0x64 + 4:
+            self.save_counter = SAVE_COUNTER.unpack_from(self.table_data[0x1], 0x64)[0]
+
+    def close(self):
+        """Releases the table views and unmaps the file."""
+        for view in self.table_data.values():
+            view.release()
+        self.table_data = {}
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
 
 # --- Main Diffing Logic ---
 def print_full_diff(old_file, new_file):
     """
     Compares two ParsedOaFile objects and prints a complete report including
     both semantic and byte-level differences.
+
+    The report is collected as lines and written to stdout in one call.
     """
-    print("\n" + "#"*80)
-    print(f"### Diffing '{old_file.filename}' (OLD) vs. '{new_file.filename}' (NEW) ###")
-    print("#"*80)
+    out = []
+    out.append("\n" + "#"*80)
+    out.append(f"### Diffing '{old_file.filename}' (OLD) vs. '{new_file.filename}' (NEW) ###")
+    out.append("#"*80)
 
     # --- Part 1: Semantic Diff ---
-    print("\n======================= SEMANTIC CHANGES =======================")
+    out.append("\n======================= SEMANTIC CHANGES =======================")
 
     # Metadata
-    print("\n[Metadata Changes]")
+    out.append("\n[Metadata Changes]")
     if old_file.save_counter != new_file.save_counter:
-        print(f"  - Save Counter incremented: {old_file.save_counter} -> {new_file.save_counter}")
+        out.append(f"  - Save Counter incremented: {old_file.save_counter} -> {new_file.save_counter}")
     else:
-        print("  - Save Counter is identical.")
+        out.append("  - Save Counter is identical.")
 
     # Schema
-    old_tables = set(old_file.table_metadata.keys())
-    new_tables = set(new_file.table_metadata.keys())
+    old_tables = old_file.table_ids
+    new_tables = new_file.table_ids
     added = new_tables - old_tables
     removed = old_tables - new_tables
 
-    print("\n[Schema (Table List) Changes]")
+    out.append("\n[Schema (Table List) Changes]")
     if added:
-        print(f"  - Tables ADDED: {', '.join(hex(t) for t in sorted(list(added)))}")
+        out.append(f"  - Tables ADDED: {', '.join(hex(t) for t in sorted(list(added)))}")
     if removed:
-        print(f"  - Tables REMOVED: {', '.join(hex(t) for t in sorted(list(removed)))}")
+        out.append(f"  - Tables REMOVED: {', '.join(hex(t) for t in sorted(list(removed)))}")
     if not added and not removed:
-        print("  - No change in the set of tables.")
+        out.append("  - No change in the set of tables.")
 
     # String Timeline
-    print("\n[String Timeline Changes]")
+    out.append("\n[String Timeline Changes]")
     str_diff = list(difflib.unified_diff(old_file.strings, new_file.strings, lineterm=''))
 
     change_found = False
     for line in str_diff:
         if line.startswith(('+', '-')) and not line.startswith(('+++', '---')):
-            print(f"  {line}")
+            out.append(f"  {line}")
             change_found = True
     if not change_found:
-         print("  - No changes to the string timeline.")
+         out.append("  - No changes to the string timeline.")
 
     # --- Part 2: Byte-Level Diff ---
-    print("\n======================= BYTE-LEVEL DIFFS =======================")
+    out.append("\n======================= BYTE-LEVEL DIFFS =======================")
 
-    all_table_ids = sorted(list(old_tables | new_tables))
+    all_table_ids = sorted(old_tables | new_tables)
     diff_found = False
 
     for table_id in all_table_ids:
         old_data = old_file.table_data.get(table_id, b'')
         new_data = new_file.table_data.get(table_id, b'')
 
-        if old_data != new_data:
+        if not same_payload(old_data, new_data):
             diff_found = True
-            print(f"\n--- Diff for Table 0x{table_id:x} ---")
-
-            old_dump = hex_dump(old_data)
-            new_dump = hex_dump(new_data)
+            out.append(f"\n--- Diff for Table 0x{table_id:x} ---")
 
-            hex_diff = list(difflib.unified_diff(old_dump, new_dump, fromfile=old_file.filename, tofile=new_file.filename, lineterm=''))
+            # Hex dump lines start with their own offset, so they can only
+            # match at the same index: 16-byte rows are compared as raw bytes
+            # and only the rows inside a hunk are ever formatted
+            hex_diff = positional_unified_diff(TableRows(old_data, 16), TableRows(new_data, 16),
+                                               n=3, format_line=hex_dump_line)
 
             # Print only relevant lines from the diff output
             for line in hex_diff:
                 if not line.startswith(('---', '+++', '@@')):
-                    print(line)
+                    out.append(line)
 
     if not diff_found:
-        print("\nNo byte-level differences found in any table data.")
+        out.append("\nNo byte-level differences found in any table data.")
+
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 if __name__ == '__main__':
@@ -152,6 +168,9 @@ if __name__ == '__main__':
     for i in range(len(parsed_files) - 1):
         print_full_diff(parsed_files[i], parsed_files[i+1])
 
+    for parsed_file in parsed_files:
+        parsed_file.close()
+
     print("\n" + "#"*80)
     print("### End of Report ###")
     print("#"*80)
@@ -1,17 +1,10 @@
-import struct
 import sys
-import difflib
-
-# Helper function to format data into a hex view similar to `xxd`
-def hex_dump(data, prefix=''):
-    """Creates a formatted hex dump of a byte string."""
-    lines = []
-    for i in range(0, len(data), 16):
-        chunk = data[i:i+16]
-        hex_part = ' '.join(f'{b:02x}' for b in chunk)
-        ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
-        lines.append(f"{prefix}{i:08x}: {hex_part:<48} |{ascii_part}|")
-    return lines
+import os
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oaparser import open_oa, same_payload
+from oaparser.hexdiff import TableRows, hex_dump_line, positional_unified_diff
 
 class OaFile:
     """A simple container to parse and hold the table structure of an .oa file."""
@@ -19,31 +12,24 @@ class OaFile:
         self.filepath = filepath
         self.tables = {}
         try:
-            with open(filepath, 'rb') as f:
-                # Read the 24-byte preface
-                header = f.read(24)
-                _, _, _, _, _, used = struct.unpack('<IHHQII', header)
-
-                # Read the table directory (IDs, Offsets, Sizes)
-                ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-                offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-                sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-
-                # Store table info in a dictionary keyed by ID for easy lookup
-                for i in range(used):
-                    # Skip tables with invalid offsets
-                    if offsets[i] != 0xffffffffffffffff:
-                        self.tables[ids[i]] = {'offset': offsets[i], 'size': sizes[i], 'data': None}
-
-                # Read the raw data for each table
-                for table_id, info in self.tables.items():
-                    f.seek(info['offset'])
-                    info['data'] = f.read(info['size'])
+            # The file stays mapped; the header and table directory are parsed
+            # by open_oa(), which already skips tables with invalid offsets.
+            # Payloads are only touched when get_data() asks for them.
+            self.oa = open_oa(filepath)
+            for table_id, entry in self.oa.tables.items():
+                self.tables[table_id] = {'offset': entry.offset, 'size': entry.size}
 
         except Exception as e:
             print(f"Error parsing {filepath}: {e}", file=sys.stderr)
             sys.exit(1)
 
+        self.table_ids = frozenset(self.tables)
+
+    def get_data(self, table_id):
+        """Returns a zero-copy view of a table's payload, or b'' if the file has no such table."""
+        view = self.oa.table(table_id)
+        return view if view is not None else b''
+
 def diff_oa_tables(file_old_path, file_new_path):
     """Compares and diffs the tables of two .oa files."""
     print(f"--- Comparing {file_old_path} (OLD) with {file_new_path} (NEW) ---\n")
@@ -51,13 +37,16 @@ def diff_oa_tables(file_old_path, file_new_path):
     oa_new = OaFile(file_new_path)
 
     # Get a sorted, unique list of all table IDs present in either file
-    all_ids = sorted(list(set(oa_old.tables.keys()) | set(oa_new.tables.keys())))
+    all_ids = sorted(oa_old.table_ids | oa_new.table_ids)
 
     for table_id in all_ids:
         table_old = oa_old.tables.get(table_id)
         table_new = oa_new.tables.get(table_id)
+        data_old = oa_old.get_data(table_id)
+        data_new = oa_new.get_data(table_id)
+        same_data = same_payload(data_old, data_new)
 
-        if table_old == table_new:
+        if table_old == table_new and same_data:
             continue # Skip identical tables (both metadata and data)
 
         print(f"[*] Found differences in Table ID 0x{table_id:x}")
@@ -72,26 +61,21 @@ def diff_oa_tables(file_old_path, file_new_path):
         print(f"  Metadata OLD: Offset={old_offset}, Size={old_size}")
         print(f"  Metadata NEW: Offset={new_offset}, Size={new_size}\n")
 
-        # Get data for diffing
-        data_old = table_old.get('data', b'') if table_old else b''
-        data_new = table_new.get('data', b'') if table_new else b''
-
-        if data_old == data_new:
+        if same_data:
             print("  NOTE: Table data is identical, only offset/size metadata changed.\n")
             continue
 
-        # Generate and print the side-by-side hex diff
-        dump_old = hex_dump(data_old)
-        dump_new = hex_dump(data_new)
-
-        diff = difflib.unified_diff(dump_old, dump_new, fromfile='OLD', tofile='NEW', lineterm='')
-        print("  --- Hex Data Diff ---")
-        for line in diff:
-            # Skip the '---' and '+++' header lines from difflib for cleaner output
-            if line.startswith('---') or line.startswith('+++') or line.startswith('@@'):
-                continue
-            print(f"  {line}")
-        print("\n")
+        # Generate and print the side-by-side hex diff. Hex dump lines start
+        # with their own offset, so they can only match at the same index:
+        # 16-byte rows are compared as raw bytes in one linear pass and only
+        # the rows inside a hunk are ever formatted
+        diff = positional_unified_diff(TableRows(data_old, 16), TableRows(data_new, 16),
+                                       n=3, format_line=hex_dump_line)
+        # Skip the '---' and '+++' header lines from difflib for cleaner
+        # output; the rest is collected and written in one call
+        out = ["  --- Hex Data Diff ---"]
+        out.extend(f"  {line}" for line in diff if not line.startswith(('---', '+++', '@@')))
+        sys.stdout.write('\n'.join(out) + '\n\n\n')
 
 
 if __name__ == '__main__':
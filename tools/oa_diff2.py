@@ -7,14 +7,31 @@ For .oa files, this tool is table-aware and compares tables individually.
 """
 
 import sys
-import struct
+import os
+import mmap
 from difflib import SequenceMatcher
-from typing import List, Tuple, BinaryIO, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Union
 
-def read_binary_file(filepath: str) -> bytes:
-    """Read a binary file and return its contents."""
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oaparser import HEADER, open_oa, same_payload, file_digest
+from oaparser.binary_curator import ASCII_TABLE
+
+# Files at least this large are memory-mapped rather than read into memory
+MMAP_THRESHOLD = 64 * 1024
+
+def read_binary_file(filepath: str) -> Union[bytes, mmap.mmap]:
+    """
+    Return a file's contents, memory-mapping large files.
+    
+    Small files are read with f.read(); for larger ones a read-only mmap is
+    returned so the kernel pages data in on demand instead of copying it all.
+    """
     with open(filepath, 'rb') as f:
-        return f.read()
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return f.read()
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
 class OaFile:
     """Parser for .oa file table structure."""
@@ -22,34 +39,28 @@ class OaFile:
         self.filepath = filepath
         self.tables = {}
         try:
-            with open(filepath, 'rb') as f:
-                # Read the 24-byte header
-                header = f.read(24)
-                _, _, _, _, _, used = struct.unpack('<IHHQII', header)
-
-                # Read the table directory (IDs, Offsets, Sizes)
-                ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-                offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-                sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-
-                # Store table info in a dictionary keyed by ID
-                for i in range(used):
-                    # Skip tables with invalid offsets
-                    if offsets[i] != 0xffffffffffffffff:
-                        self.tables[ids[i]] = {
-                            'offset': offsets[i], 
-                            'size': sizes[i], 
-                            'data': None
-                        }
-
-                # Read the raw data for each table
-                for table_id, info in self.tables.items():
-                    f.seek(info['offset'])
-                    info['data'] = f.read(info['size'])
+            # Memory-map the file and parse the 24-byte header and table
+            # directory (IDs, Offsets, Sizes) once
+            self.oa = open_oa(filepath)
+
+            # Store table info in a dictionary keyed by ID; tables with
+            # invalid offsets are already skipped by open_oa(). Payloads are
+            # only touched when get_data() asks for them.
+            for table_id, entry in self.oa.tables.items():
+                self.tables[table_id] = {
+                    'offset': entry.offset, 
+                    'size': entry.size
+                }
 
         except Exception as e:
             raise RuntimeError(f"Error parsing {filepath}: {e}")
 
+        self.table_ids = frozenset(self.tables)
+
+    def get_data(self, table_id: int) -> Optional[memoryview]:
+        """Return a table's payload on demand as a zero-copy view, or None."""
+        return self.oa.table(table_id)
+
 def is_oa_file(filepath: str) -> bool:
     """Check if a file is an .oa file by extension or header."""
     if filepath.endswith('.oa'):
@@ -59,7 +70,7 @@ def is_oa_file(filepath: str) -> bool:
             header = f.read(24)
             if len(header) == 24:
                 # Try to parse as OA header
-                struct.unpack('<IHHQII', header)
+                HEADER.unpack(header)
                 return True
     except:
         pass
@@ -67,38 +78,247 @@ def is_oa_file(filepath: str) -> bool:
 
 def format_hex_ascii(data: bytes, max_len: int = 32) -> str:
     """Format bytes as hex with ASCII, like hexdump."""
-    s = ' '.join(f'{b:02x}' for b in data[:max_len])
-    ascii_str = ''.join(chr(b) if 32 <= b < 127 else '.' for b in data[:max_len])
+    chunk = bytes(data[:max_len])
+    s = chunk.hex(' ')
+    ascii_str = chunk.translate(ASCII_TABLE).decode('ascii')
     if len(data) > max_len:
         s += '...'
         ascii_str += '...'
     return f"{s:<96} |{ascii_str}|"
 
-def binary_diff(data1: bytes, data2: bytes) -> List[Tuple[str, int, int, bytes, bytes]]:
+# Edit distance beyond which myers_diff() gives up; its work grows with
+# (N+M)*D, so very different inputs are left to SequenceMatcher instead
+MYERS_MAX_EDITS = 2048
+
+# Bounds on the edit budget of the Myers pass in binary_diff_opcodes(): at
+# most one edit per MYERS_EDIT_RATIO input bytes, and D*(N+M) at most
+# MYERS_MAX_WORK. Giving up is not free, since the rounds already run are
+# thrown away, so the budget scales with the input instead of being fixed.
+# The differing middles of the sample tables stay well inside both bounds.
+MYERS_EDIT_RATIO = 4
+MYERS_MAX_WORK = 1 << 20
+
+def myers_edit_budget(size: int) -> int:
+    """
+    Edit budget for a Myers pass over size = N+M bytes.
+    
+    Both bounds cap the rounds wasted on inputs that end up with
+    SequenceMatcher: the budget peaks at sqrt(MYERS_MAX_WORK / MYERS_EDIT_RATIO)
+    edits, 512, where an unrelated pair wastes about 0.06 s of Myers rounds.
+    """
+    return min(MYERS_MAX_EDITS, size // MYERS_EDIT_RATIO, MYERS_MAX_WORK // max(size, 1))
+
+# Snakes are first probed with a block compare of this many bytes; shorter
+# runs are followed byte by byte, longer ones by _equal_run()
+SNAKE_PROBE = 8
+
+def _equal_run(a: bytes, b: bytes, x: int, y: int) -> int:
     """
-    Compare two binary streams and return differences.
+    Length of the common run starting at a[x] and b[y].
+    
+    Gallops through doubling blocks compared as slices (memcmp), then binary
+    searches the first block that differs, so a run of length L costs
+    O(log L) compares rather than L byte steps. Blocks are cut from
+    memoryviews and compared as bytes, as in _equal_tail().
+    """
+    mv1, mv2 = memoryview(a), memoryview(b)
+    run, step = 0, 64
+    while True:
+        chunk = mv1[x + run:x + run + step].tobytes()
+        if chunk != mv2[y + run:y + run + step].tobytes():
+            break
+        run += len(chunk)
+        if len(chunk) < step:
+            return run          # reached the end of both inputs
+        step *= 2
+    # The first mismatch (or the end of one input) is within the next step bytes
+    while step > 1:
+        step //= 2
+        chunk = mv1[x + run:x + run + step].tobytes()
+        if chunk == mv2[y + run:y + run + step].tobytes():
+            run += len(chunk)
+    return run
+
+def _equal_tail(a: bytes, b: bytes, limit: int) -> int:
+    """
+    Length of the common run ending at the ends of a and b, at most limit.
+    
+    Gallops backwards through doubling blocks, then binary searches the first
+    block that differs, as _equal_run() does forward. Blocks are cut from
+    memoryviews and compared as bytes, so only the bytes visited are copied.
+    """
+    mv1, mv2 = memoryview(a), memoryview(b)
+    end1, end2 = len(a), len(b)
+    run, step = 0, 64
+    while True:
+        size = min(step, limit - run)
+        if size <= 0:
+            return run          # reached the limit
+        if (mv1[end1 - run - size:end1 - run].tobytes() !=
+                mv2[end2 - run - size:end2 - run].tobytes()):
+            break
+        run += size
+        step *= 2
+    # The first mismatch (from the end) is within the next size bytes
+    while size > 1:
+        half = size // 2
+        if (mv1[end1 - run - half:end1 - run].tobytes() ==
+                mv2[end2 - run - half:end2 - run].tobytes()):
+            run += half
+            size -= half
+        else:
+            size = half
+    return run
+
+def myers_diff(a: bytes, b: bytes, max_edits: int = MYERS_MAX_EDITS) -> Optional[List[Tuple[str, int, int, int, int]]]:
+    """
+    Diff two byte strings with Myers' O(ND) algorithm (Myers 1986, section 2).
+    
+    Returns opcodes in the same (tag, i1, i2, j1, j2) form as
+    SequenceMatcher.get_opcodes(), with adjacent deletes and inserts folded
+    into 'replace'. Returns None if the edit distance exceeds max_edits.
+    """
+    n, m = len(a), len(b)
+    max_d = min(n + m, max_edits)
+    off = max_d + 1
+    v = [0] * (2 * max_d + 3)
+    trace = []
+    
+    # Forward pass: v[off + k] is the furthest x reached on diagonal k = x - y.
+    # The loop runs over i = off + k directly to keep index arithmetic out of it.
+    for d in range(max_d + 1):
+        # Round d only reads diagonals -d-1..d+1, so only that window is saved
+        trace.append(v[off - d - 1:off + d + 2])
+        lo, hi = off - d, off + d
+        for i in range(lo, hi + 1, 2):
+            if i == lo or (i != hi and v[i - 1] < v[i + 1]):
+                x = v[i + 1]                # step down: insert from b
+            else:
+                x = v[i - 1] + 1            # step right: delete from a
+            y = x - i + off
+            if x < n and y < m and a[x] == b[y]:
+                # Follow the snake; runs longer than a few bytes are skipped
+                # with block compares instead of stepping byte by byte
+                head = a[x:x + SNAKE_PROBE]
+                if head == b[y:y + SNAKE_PROBE]:
+                    run = len(head) + _equal_run(a, b, x + len(head), y + len(head))
+                    x += run
+                    y += run
+                else:
+                    while x < n and y < m and a[x] == b[y]:
+                        x += 1
+                        y += 1
+            v[i] = x
+            if x >= n and y >= m:
+                return _opcodes_from_blocks(_myers_backtrack(trace, n, m), n, m)
+    return None
+
+def _myers_backtrack(trace: List[List[int]], n: int, m: int) -> List[Tuple[int, int, int]]:
+    """Walk the saved V windows back from (n, m) and return the matching blocks."""
+    blocks = []
+    x, y = n, m
+    for d in range(len(trace) - 1, -1, -1):
+        # trace[d] holds diagonals -d-1..d+1, so diagonal k is at index k + d + 1
+        v = trace[d]
+        k = x - y
+        w = k + d + 1
+        if k == -d or (k != d and v[w - 1] < v[w + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[prev_k + d + 1]
+        if d == 0:
+            snake_start = 0
+        else:
+            snake_start = prev_x if prev_k == k + 1 else prev_x + 1
+        if x > snake_start:
+            blocks.append((snake_start, snake_start - k, x - snake_start))
+        x, y = prev_x, prev_x - prev_k
+    blocks.reverse()
+    return blocks
+
+def _opcodes_from_blocks(blocks: List[Tuple[int, int, int]], n: int, m: int) -> List[Tuple[str, int, int, int, int]]:
+    """Turn matching blocks into opcodes, as SequenceMatcher.get_opcodes() does."""
+    opcodes = []
+    i = j = 0
+    for ai, bj, size in blocks + [(n, m, 0)]:
+        if i < ai and j < bj:
+            opcodes.append(('replace', i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(('delete', i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(('insert', i, ai, j, bj))
+        if size:
+            opcodes.append(('equal', ai, ai + size, bj, bj + size))
+        i, j = ai + size, bj + size
+    return opcodes
+
+def binary_diff_opcodes(data1: bytes, data2: bytes) -> List[Tuple[str, int, int, int, int]]:
+    """
+    Compare two binary streams and return opcodes without any byte content.
+    
+    The common prefix and suffix are stripped first, and the differing middle
+    is diffed with Myers' algorithm. SequenceMatcher is only used when the
+    streams are too different for Myers to finish within myers_edit_budget().
+    The Myers rounds run before giving up are wasted, so very different
+    middles pay for up to that many rounds on top of the SequenceMatcher diff.
     
     Returns:
-        List of tuples: (operation, offset1, offset2, bytes1, bytes2)
+        List of tuples: (operation, i1, i2, j1, j2) as in SequenceMatcher,
         operation: 'equal', 'replace', 'delete', 'insert'
     """
-    matcher = SequenceMatcher(None, data1, data2, autojunk=False)
-    differences = []
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-        differences.append((tag, i1, i2, data1[i1:i2], data2[j1:j2]))
-    return differences
+    # Common ends are found by galloping block compares; the suffix search
+    # is capped so it cannot overlap the prefix
+    prefix = _equal_run(data1, data2, 0, 0)
+    suffix = _equal_tail(data1, data2, min(len(data1), len(data2)) - prefix)
+    end1, end2 = len(data1) - suffix, len(data2) - suffix
+    
+    result = []
+    if prefix:
+        result.append(('equal', 0, prefix, 0, prefix))
+    
+    # The matchers index and hash single bytes, so they get bytes copies of
+    # the (usually small) differing middle
+    middle1 = bytes(memoryview(data1)[prefix:end1])
+    middle2 = bytes(memoryview(data2)[prefix:end2])
+    opcodes = myers_diff(middle1, middle2, myers_edit_budget(len(middle1) + len(middle2)))
+    if opcodes is None:
+        opcodes = SequenceMatcher(None, middle1, middle2, autojunk=False).get_opcodes()
+    for tag, i1, i2, j1, j2 in opcodes:
+        result.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+    
+    if suffix:
+        result.append(('equal', end1, len(data1), end2, len(data2)))
+    return result
 
-def print_diff(differences: List[Tuple[str, int, int, bytes, bytes]], 
-               context: str = 'none', context_bytes: int = 16):
+def opcodes_with_bytes(opcodes: List[Tuple[str, int, int, int, int]],
+                       data1: bytes, data2: bytes) -> List[Tuple[str, int, int, memoryview, memoryview]]:
     """
-    Print differences in a compact format.
+    Attach the byte runs each opcode covers, for format_diff().
+    
+    Returns:
+        List of tuples: (operation, offset1, offset2, bytes1, bytes2)
+        bytes1/bytes2 are zero-copy memoryview slices of the inputs
+    """
+    mv1, mv2 = memoryview(data1), memoryview(data2)
+    return [(tag, i1, i2, mv1[i1:i2], mv2[j1:j2]) for tag, i1, i2, j1, j2 in opcodes]
+
+def binary_diff(data1: bytes, data2: bytes) -> List[Tuple[str, int, int, memoryview, memoryview]]:
+    """Compare two binary streams and return opcodes with their byte runs attached."""
+    return opcodes_with_bytes(binary_diff_opcodes(data1, data2), data1, data2)
+
+def format_diff(differences: List[Tuple[str, int, int, bytes, bytes]], 
+                context: str = 'none', context_bytes: int = 16) -> List[str]:
+    """
+    Format differences in a compact format, one string per output line.
     
     Args:
         context: 'none', 'medium', or 'full'
         context_bytes: Number of bytes to show around changes for 'medium' context
     """
+    out = []
     total_changes = sum(1 for d in differences if d[0] != 'equal')
-    print(f"Operations: {len(differences)}, Changes: {total_changes}")
+    out.append(f"Operations: {len(differences)}, Changes: {total_changes}")
     
     for tag, i1, i2, bytes1, bytes2 in differences:
         size1 = i2 - i1
@@ -110,58 +330,92 @@ def print_diff(differences: List[Tuple[str, int, int, bytes, bytes]],
                 chunk_size = 32
                 for offset in range(0, size1, chunk_size):
                     chunk = bytes1[offset:offset + chunk_size]
-                    print(f"[{i1+offset:08x}]   {format_hex_ascii(chunk)}")
+                    out.append(f"[{i1+offset:08x}]   {format_hex_ascii(chunk)}")
             elif context == 'medium':
                 # Show limited context around changes
                 if size1 <= context_bytes * 2:
                     # Show all if small enough
-                    print(f"[{i1:08x}]   {format_hex_ascii(bytes1[:context_bytes])}")
+                    out.append(f"[{i1:08x}]   {format_hex_ascii(bytes1[:context_bytes])}")
                 else:
                     # Show first and last context_bytes
-                    print(f"[{i1:08x}]   {format_hex_ascii(bytes1[:context_bytes])}")
+                    out.append(f"[{i1:08x}]   {format_hex_ascii(bytes1[:context_bytes])}")
                     if size1 > context_bytes * 2:
-                        print(f"         ... ({size1 - context_bytes * 2} bytes omitted) ...")
-                    print(f"[{i2-context_bytes:08x}]   {format_hex_ascii(bytes1[-context_bytes:])}")
+                        out.append(f"         ... ({size1 - context_bytes * 2} bytes omitted) ...")
+                    out.append(f"[{i2-context_bytes:08x}]   {format_hex_ascii(bytes1[-context_bytes:])}")
         
         elif tag == 'replace':
             sz = f" [{size2-size1:+d}]" if size1 != size2 else ""
-            print(f"[{i1:08x}] ~ {size1}->{size2}b{sz}: replaced {size1} bytes")
-            print(f"  - {format_hex_ascii(bytes1)}")
-            print(f"  + {format_hex_ascii(bytes2)}")
+            out.append(f"[{i1:08x}] ~ {size1}->{size2}b{sz}: replaced {size1} bytes")
+            out.append(f"  - {format_hex_ascii(bytes1)}")
+            out.append(f"  + {format_hex_ascii(bytes2)}")
         
         elif tag == 'delete':
-            print(f"[{i1:08x}] - {size1}b: deleted {size1} bytes")
-            print(f"  - {format_hex_ascii(bytes1)}")
+            out.append(f"[{i1:08x}] - {size1}b: deleted {size1} bytes")
+            out.append(f"  - {format_hex_ascii(bytes1)}")
         
         elif tag == 'insert':
-            print(f"[{i1:08x}] + {size2}b: inserted {size2} bytes")
-            print(f"  + {format_hex_ascii(bytes2)}")
+            out.append(f"[{i1:08x}] + {size2}b: inserted {size2} bytes")
+            out.append(f"  + {format_hex_ascii(bytes2)}")
+    return out
 
-def print_summary(differences: List[Tuple[str, int, int, bytes, bytes]]):
-    """Print a compact summary of changes."""
+def print_diff(differences: List[Tuple[str, int, int, bytes, bytes]], 
+               context: str = 'none', context_bytes: int = 16):
+    """Print differences in a compact format, written to stdout in one call."""
+    sys.stdout.write('\n'.join(format_diff(differences, context, context_bytes)) + '\n')
+
+def format_summary(opcodes: List[Tuple[str, int, int, int, int]]) -> List[str]:
+    """Format a compact summary of changes as output lines; needs only opcodes."""
     stats = {'replace': 0, 'delete': 0, 'insert': 0, 
              'bytes_replaced': 0, 'bytes_deleted': 0, 'bytes_inserted': 0}
     
-    for tag, i1, i2, bytes1, bytes2 in differences:
+    for tag, i1, i2, j1, j2 in opcodes:
         if tag == 'replace':
             stats['replace'] += 1
-            stats['bytes_replaced'] += len(bytes1)
+            stats['bytes_replaced'] += i2 - i1
         elif tag == 'delete':
             stats['delete'] += 1
-            stats['bytes_deleted'] += len(bytes1)
+            stats['bytes_deleted'] += i2 - i1
         elif tag == 'insert':
             stats['insert'] += 1
-            stats['bytes_inserted'] += len(bytes2)
+            stats['bytes_inserted'] += j2 - j1
     
-    print(f"\nReplace: {stats['replace']} ops, {stats['bytes_replaced']} bytes")
-    print(f"Delete:  {stats['delete']} ops, {stats['bytes_deleted']} bytes")
-    print(f"Insert:  {stats['insert']} ops, {stats['bytes_inserted']} bytes")
-    print(f"Net:     {stats['bytes_inserted'] - stats['bytes_deleted']:+d} bytes")
+    return [
+        f"\nReplace: {stats['replace']} ops, {stats['bytes_replaced']} bytes",
+        f"Delete:  {stats['delete']} ops, {stats['bytes_deleted']} bytes",
+        f"Insert:  {stats['insert']} ops, {stats['bytes_inserted']} bytes",
+        f"Net:     {stats['bytes_inserted'] - stats['bytes_deleted']:+d} bytes",
+    ]
+
+def print_summary(opcodes: List[Tuple[str, int, int, int, int]]):
+    """Print a compact summary of changes."""
+    sys.stdout.write('\n'.join(format_summary(opcodes)) + '\n')
+
+def _diff_one_table(table_id: int, table_old: Dict, table_new: Dict, data_old: bytes, data_new: bytes,
+                    context: str, context_bytes: int) -> str:
+    """Diff one modified table and return its rendered report block."""
+    lines = [
+        f"[*] Table 0x{table_id:x} - MODIFIED",
+        f"    OLD: offset=0x{table_old['offset']:x}, size={table_old['size']}b",
+        f"    NEW: offset=0x{table_new['offset']:x}, size={table_new['size']}b",
+        f"    Diff: {len(data_new) - len(data_old):+d}b",
+    ]
+    
+    # Run binary diff on table data
+    opcodes = binary_diff_opcodes(data_old, data_new)
+    differences = opcodes_with_bytes(opcodes, data_old, data_new)
+    lines.extend(format_diff(differences, context=context, context_bytes=context_bytes))
+    lines.extend(format_summary(opcodes))
+    return '\n'.join(lines) + '\n\n'
 
 def diff_oa_files(file1: str, file2: str, context: str = 'none', context_bytes: int = 16):
     """Diff two .oa files table by table."""
     print(f"--- Table-aware diff: {file1} (OLD) vs {file2} (NEW) ---\n")
     
+    # Byte-identical files need no parsing at all
+    if file_digest(file1) == file_digest(file2):
+        print("Files are identical")
+        return
+    
     try:
         oa_old = OaFile(file1)
         oa_new = OaFile(file2)
@@ -170,46 +424,45 @@ def diff_oa_files(file1: str, file2: str, context: str = 'none', context_bytes:
         sys.exit(1)
     
     # Get all table IDs from both files
-    all_ids = sorted(list(set(oa_old.tables.keys()) | set(oa_new.tables.keys())))
+    all_ids = sorted(oa_old.table_ids | oa_new.table_ids)
     
     total_tables = len(all_ids)
     changed_tables = 0
     
+    # Report blocks in table order, written once all tables are compared
+    blocks = []
+    
     for table_id in all_ids:
         table_old = oa_old.tables.get(table_id)
         table_new = oa_new.tables.get(table_id)
         
         # Handle missing tables
         if table_old is None:
-            print(f"[*] Table 0x{table_id:x} - ADDED in NEW")
-            print(f"    Size: {table_new['size']}b\n")
+            blocks.append(f"[*] Table 0x{table_id:x} - ADDED in NEW\n"
+                          f"    Size: {table_new['size']}b\n\n")
             changed_tables += 1
             continue
         
         if table_new is None:
-            print(f"[*] Table 0x{table_id:x} - REMOVED in OLD")
-            print(f"    Size: {table_old['size']}b\n")
+            blocks.append(f"[*] Table 0x{table_id:x} - REMOVED in OLD\n"
+                          f"    Size: {table_old['size']}b\n\n")
             changed_tables += 1
             continue
         
         # Compare table data
-        data_old = table_old['data']
-        data_new = table_new['data']
+        data_old = oa_old.get_data(table_id)
+        data_new = oa_new.get_data(table_id)
         
-        if data_old == data_new:
-            continue  # Skip identical tables
+        if same_payload(data_old, data_new):
+            continue  # Skip identical tables (size mismatch short-circuits)
         
         changed_tables += 1
-        print(f"[*] Table 0x{table_id:x} - MODIFIED")
-        print(f"    OLD: offset=0x{table_old['offset']:x}, size={table_old['size']}b")
-        print(f"    NEW: offset=0x{table_new['offset']:x}, size={table_new['size']}b")
-        print(f"    Diff: {len(data_new) - len(data_old):+d}b")
-        
-        # Run binary diff on table data
-        differences = binary_diff(data_old, data_new)
-        print_diff(differences, context=context, context_bytes=context_bytes)
-        print_summary(differences)
-        print()
+        # Myers diffs a table in well under a millisecond, so the tables are
+        # diffed in this process; a worker pool only added fork and pickle cost
+        blocks.append(_diff_one_table(table_id, table_old, table_new, data_old, data_new,
+                                      context, context_bytes))
+    
+    sys.stdout.write(''.join(blocks))
     
     print(f"Summary: {changed_tables}/{total_tables} tables changed")
 
@@ -255,9 +508,10 @@ def main():
             data1 = read_binary_file(file1)
             data2 = read_binary_file(file2)
             print(f"{file1}: {len(data1)}b, {file2}: {len(data2)}b, diff: {len(data2)-len(data1):+d}b")
-            differences = binary_diff(data1, data2)
-            print_diff(differences, context=context, context_bytes=context_bytes)
-            print_summary(differences)
+            opcodes = binary_diff_opcodes(data1, data2)
+            print_diff(opcodes_with_bytes(opcodes, data1, data2),
+                       context=context, context_bytes=context_bytes)
+            print_summary(opcodes)
     except FileNotFoundError as e:
         print(f"Error: {e}")
         sys.exit(1)
@@ -3,9 +3,9 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import struct
 import difflib
-import io
+import itertools
+import re
 
 # Import the intelligent parsers for all tables
 from parsers.table_c_parser import HypothesisParser
@@ -15,48 +15,50 @@ from parsers.table_1d_parser import Table1dParser
 from parsers.table_133_parser import Table133Parser
 from parsers.table_1_parser import Table1Parser
 from parsers.table_107_parser import Table107Parser
-from oaparser import render_regions_to_string
+from oaparser import open_oa, render_regions_to_string, same_payload
+from oaparser.binary_curator import ClaimedRegion
 
 # Import binary diff functions from oa_diff2
-from oa_diff2 import binary_diff, print_diff, format_hex_ascii
-
-# Helper function to format data into a hex view similar to `xxd`
-def hex_dump(data, prefix=''):
-    """Creates a formatted hex dump of a byte string."""
-    lines = []
-    for i in range(0, len(data), 16):
-        chunk = data[i:i+16]
-        hex_part = ' '.join(f'{b:02x}' for b in chunk)
-        ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
-        lines.append(f"{prefix}{i:08x}: {hex_part:<48} |{ascii_part}|")
-    return lines
+from oa_diff2 import binary_diff, format_diff, format_hex_ascii
+
+# Record offsets shift whenever anything before them changes, so they are
+# masked out before Table 0xc records are compared
+OFFSET_AT = re.compile(r' at 0x[0-9a-f]+')
+OFFSET_LABEL = re.compile(r'Offset 0x[0-9a-f]+:')
+
+def normalize_offsets(text):
+    """Replaces the offsets in a rendered record with placeholders."""
+    return OFFSET_LABEL.sub('Offset:', OFFSET_AT.sub(' at [offset]', text))
+
+# Structured tables whose parsed regions are rendered and diffed line by
+# line: table_id -> (parser class, description for the diff heading)
+STRUCTURED_TABLES = {
+    0x1: (Table1Parser, "Global Metadata"),
+    0xa: (TableAParser, "String Table"),
+    0xb: (TableBParser, "Property List"),
+    0x1d: (Table1dParser, "Table Directory"),
+    0x133: (Table133Parser, None),
+}
+
+# Tables with their own branch in diff_oa_tables; all others get a binary diff
+SPECIALIZED_TABLES = STRUCTURED_TABLES.keys() | {0xc, 0x107}
 
 class OaFile:
     """A simple container to parse and hold the table structure of an .oa file."""
     def __init__(self, filepath):
         self.filepath = filepath
         self.tables = {}
+        # Parser output is memoized per table, so a file diffed against
+        # several others is only parsed once
+        self._parsed_lines = {}
+        self._records = None
         try:
-            with open(filepath, 'rb') as f:
-                # Read the 24-byte preface
-                header = f.read(24)
-                _, _, _, _, _, used = struct.unpack('<IHHQII', header)
-
-                # Read the table directory (IDs, Offsets, Sizes)
-                ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-                offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-                sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-
-                # Store table info in a dictionary keyed by ID for easy lookup
-                for i in range(used):
-                    # Skip tables with invalid offsets
-                    if offsets[i] != 0xffffffffffffffff:
-                        self.tables[ids[i]] = {'offset': offsets[i], 'size': sizes[i], 'data': None}
-
-                # Read the raw data for each table
-                for table_id, info in self.tables.items():
-                    f.seek(info['offset'])
-                    info['data'] = f.read(info['size'])
+            # The file stays mapped; the header and table directory are parsed
+            # by open_oa(), which already skips tables with invalid offsets.
+            # Payloads are only touched when get_data() or read() asks for them.
+            self.oa = open_oa(filepath)
+            for table_id, entry in self.oa.tables.items():
+                self.tables[table_id] = {'offset': entry.offset, 'size': entry.size}
 
         except FileNotFoundError:
             print(f"Error: File not found at {filepath}", file=sys.stderr)
@@ -65,6 +67,66 @@ class OaFile:
             print(f"Error parsing {filepath}: {e}", file=sys.stderr)
             sys.exit(1)
 
+        self.table_ids = frozenset(self.tables)
+
+    def get_data(self, table_id):
+        """Returns a zero-copy view of a table's payload, or b'' if the file has no such table."""
+        view = self.oa.table(table_id)
+        return view if view is not None else b''
+
+    def read(self, table_id):
+        """Returns a bytes copy of a table's payload for the parsers, or None if absent."""
+        return self.oa.read(table_id)
+
+    def parsed_lines(self, table_id):
+        """Returns the rendered regions of a structured table as lines, parsing it on first use."""
+        lines = self._parsed_lines.get(table_id)
+        if lines is None:
+            parser_class, _ = STRUCTURED_TABLES[table_id]
+            regions = parser_class(self.read(table_id) or b'').parse()
+            lines = self._parsed_lines[table_id] = render_regions_to_string(regions, "").split('\n')
+        return lines
+
+    def records(self):
+        """Returns the parsed records of Table 0xc, parsing it on first use."""
+        if self._records is None:
+            # The string table is used for string resolution
+            regions = HypothesisParser(self.read(0xc) or b'', self.read(0xa)).parse()
+            self._records = [region.parsed_value for region in regions
+                             if isinstance(region, ClaimedRegion) and region.parsed_value]
+        return self._records
+
+# filepath -> OaFile, so a file diffed against several others is only
+# read and parsed once
+OA_FILES = {}
+
+def get_oa_file(filepath):
+    """Returns the OaFile for a path, creating it on first use."""
+    oa_file = OA_FILES.get(filepath)
+    if oa_file is None:
+        oa_file = OA_FILES[filepath] = OaFile(filepath)
+    return oa_file
+
+def print_structured_diff(table_id, oa_old, oa_new):
+    """Prints a unified diff of the rendered regions of a structured table."""
+    _, description = STRUCTURED_TABLES[table_id]
+    if description:
+        print(f"  --- Structured Diff for Table 0x{table_id:x} ({description}) ---")
+    else:
+        print(f"  --- Structured Diff for Table 0x{table_id:x} ---")
+
+    diff = difflib.unified_diff(oa_old.parsed_lines(table_id), oa_new.parsed_lines(table_id),
+                                fromfile='OLD', tofile='NEW', lineterm='')
+    # Collect the diff and write it once instead of a print() per line
+    out = [f"  {line}" for line in itertools.islice(diff, 2, None)] # Skip the ---/+++ file headers
+    if not out:
+        out.append("  NOTE: Parsed structure is identical.")
+    sys.stdout.write('\n'.join(out) + '\n\n\n')
+
+def _binary_diff_lines(data_old, data_new):
+    """Binary diff of one table's data, as context=none output lines."""
+    return format_diff(binary_diff(data_old, data_new), context='none')
+
 def diff_oa_tables(file_old_path, file_new_path):
     """
     Compares the tables of two .oa files. For Table 0xc, it performs a
@@ -72,17 +134,20 @@ def diff_oa_tables(file_old_path, file_new_path):
     standard hex-level diff.
     """
     print(f"--- Comparing {file_old_path} (OLD) with {file_new_path} (NEW) ---\n")
-    oa_old = OaFile(file_old_path)
-    oa_new = OaFile(file_new_path)
+    oa_old = get_oa_file(file_old_path)
+    oa_new = get_oa_file(file_new_path)
 
     # Get a sorted, unique list of all table IDs present in either file
-    all_ids = sorted(list(set(oa_old.tables.keys()) | set(oa_new.tables.keys())))
+    all_ids = sorted(oa_old.table_ids | oa_new.table_ids)
 
     for table_id in all_ids:
         table_old = oa_old.tables.get(table_id)
         table_new = oa_new.tables.get(table_id)
+        data_old = oa_old.get_data(table_id)
+        data_new = oa_new.get_data(table_id)
+        same_data = same_payload(data_old, data_new)
 
-        if table_old == table_new:
+        if table_old == table_new and same_data:
             continue # Skip identical tables (both metadata and data)
 
         print(f"[*] Found differences in Table ID 0x{table_id:x}")
@@ -97,132 +162,19 @@ def diff_oa_tables(file_old_path, file_new_path):
         print(f"  Metadata OLD: Offset={old_offset}, Size={old_size}")
         print(f"  Metadata NEW: Offset={new_offset}, Size={new_size}\n")
 
-        data_old = table_old.get('data', b'') if table_old else b''
-        data_new = table_new.get('data', b'') if table_new else b''
-
-        if data_old == data_new:
+        if same_data:
             print("  NOTE: Table data is identical, only offset/size metadata changed.\n")
             continue
 
-        # --- SPECIALIZED DIFF FOR TABLE 0x1 ---
-        if table_id == 0x1:
-            print("  --- Structured Diff for Table 0x1 (Global Metadata) ---")
-            parser_old = Table1Parser(data_old)
-            parser_new = Table1Parser(data_new)
-            regions_old = parser_old.parse()
-            regions_new = parser_new.parse()
-            lines_old = render_regions_to_string(regions_old, "").split('\n')
-            lines_new = render_regions_to_string(regions_new, "").split('\n')
-
-            diff = difflib.unified_diff(lines_old, lines_new, fromfile='OLD', tofile='NEW', lineterm='')
-            
-            diff_lines = list(diff)[2:] # Skip the ---/+++ file headers
-            if not diff_lines:
-                 print("  NOTE: Parsed structure is identical.")
-            else:
-                for line in diff_lines:
-                    print(f"  {line}")
-            print("\n")
-            continue
-
-        # --- SPECIALIZED DIFF FOR TABLE 0xa ---
-        if table_id == 0xa:
-            print("  --- Structured Diff for Table 0xa (String Table) ---")
-            parser_old = TableAParser(data_old)
-            parser_new = TableAParser(data_new)
-            regions_old = parser_old.parse()
-            regions_new = parser_new.parse()
-            lines_old = render_regions_to_string(regions_old, "").split('\n')
-            lines_new = render_regions_to_string(regions_new, "").split('\n')
-
-            diff = difflib.unified_diff(lines_old, lines_new, fromfile='OLD', tofile='NEW', lineterm='')
-            
-            diff_lines = list(diff)[2:]
-            if not diff_lines:
-                 print("  NOTE: Parsed structure is identical.")
-            else:
-                for line in diff_lines:
-                    print(f"  {line}")
-            print("\n")
-            continue
-
-        # --- SPECIALIZED DIFF FOR TABLE 0xb ---
-        if table_id == 0xb:
-            print("  --- Structured Diff for Table 0xb (Property List) ---")
-            parser_old = TableBParser(data_old)
-            parser_new = TableBParser(data_new)
-            regions_old = parser_old.parse()
-            regions_new = parser_new.parse()
-            lines_old = render_regions_to_string(regions_old, "").split('\n')
-            lines_new = render_regions_to_string(regions_new, "").split('\n')
-
-            diff = difflib.unified_diff(lines_old, lines_new, fromfile='OLD', tofile='NEW', lineterm='')
-            
-            diff_lines = list(diff)[2:]
-            if not diff_lines:
-                 print("  NOTE: Parsed structure is identical.")
-            else:
-                for line in diff_lines:
-                    print(f"  {line}")
-            print("\n")
-            continue
-
-        # --- SPECIALIZED DIFF FOR TABLE 0x1d ---
-        if table_id == 0x1d:
-            print("  --- Structured Diff for Table 0x1d (Table Directory) ---")
-            parser_old = Table1dParser(data_old)
-            parser_new = Table1dParser(data_new)
-            regions_old = parser_old.parse()
-            regions_new = parser_new.parse()
-            lines_old = render_regions_to_string(regions_old, "").split('\n')
-            lines_new = render_regions_to_string(regions_new, "").split('\n')
-
-            diff = difflib.unified_diff(lines_old, lines_new, fromfile='OLD', tofile='NEW', lineterm='')
-            
-            diff_lines = list(diff)[2:]
-            if not diff_lines:
-                 print("  NOTE: Parsed structure is identical.")
-            else:
-                for line in diff_lines:
-                    print(f"  {line}")
-            print("\n")
-            continue
-
-        # --- SPECIALIZED DIFF FOR TABLE 0x133 ---
-        if table_id == 0x133:
-            print("  --- Structured Diff for Table 0x133 ---")
-            parser_old = Table133Parser(data_old)
-            parser_new = Table133Parser(data_new)
-            regions_old = parser_old.parse()
-            regions_new = parser_new.parse()
-            lines_old = render_regions_to_string(regions_old, "").split('\n')
-            lines_new = render_regions_to_string(regions_new, "").split('\n')
-
-            diff = difflib.unified_diff(lines_old, lines_new, fromfile='OLD', tofile='NEW', lineterm='')
-            
-            diff_lines = list(diff)[2:]
-            if not diff_lines:
-                 print("  NOTE: Parsed structure is identical.")
-            else:
-                for line in diff_lines:
-                    print(f"  {line}")
-            print("\n")
+        # --- SPECIALIZED DIFFS FOR TABLES 0x1, 0xa, 0xb, 0x1d, 0x133 ---
+        if table_id in STRUCTURED_TABLES:
+            print_structured_diff(table_id, oa_old, oa_new)
             continue
 
         # --- SPECIALIZED DIFF FOR TABLE 0xc ---
         if table_id == 0xc:
             print("  --- Structured Diff for Table 0xc (Netlist Data) ---")
             
-            # Get string table for string resolution
-            string_table_old = oa_old.tables.get(0xa, {}).get('data')
-            string_table_new = oa_new.tables.get(0xa, {}).get('data')
-            
-            parser_old = HypothesisParser(data_old, string_table_old)
-            parser_old.parse()
-            
-            parser_new = HypothesisParser(data_new, string_table_new)
-            parser_new.parse()
-            
             # For diffing, we want to show only the actual changes in content,
             # not spurious differences caused by offset shifts.
             # Strategy: For each record, extract its "signature" (type + key fields)
@@ -248,78 +200,45 @@ def diff_oa_tables(file_old_path, file_new_path):
                 else:
                     return (record_type, str(record)[:50])
             
-            # Parse to get regions
-            from oaparser.binary_curator import ClaimedRegion
-            regions_old = parser_old.parse()
-            regions_new = parser_new.parse()
-            
-            # Extract records from regions
-            records_old = []
-            for region in regions_old:
-                if isinstance(region, ClaimedRegion) and region.parsed_value:
-                    records_old.append(region.parsed_value)
-            
-            records_new = []
-            for region in regions_new:
-                if isinstance(region, ClaimedRegion) and region.parsed_value:
-                    records_new.append(region.parsed_value)
+            records_old = oa_old.records()
+            records_new = oa_new.records()
             
             # Build signature maps
             old_by_sig = {}
             for i, r in enumerate(records_old):
-                sig = get_record_signature(r)
-                if sig not in old_by_sig:
-                    old_by_sig[sig] = []
-                old_by_sig[sig].append((i, r))
+                old_by_sig.setdefault(get_record_signature(r), []).append((i, r))
             
             new_by_sig = {}
             for i, r in enumerate(records_new):
-                sig = get_record_signature(r)
-                if sig not in new_by_sig:
-                    new_by_sig[sig] = []
-                new_by_sig[sig].append((i, r))
+                new_by_sig.setdefault(get_record_signature(r), []).append((i, r))
             
-            # Find matching and non-matching records
+            # Find matching and non-matching records in one walk over the old
+            # signatures: records sharing a signature are matched one-to-one
+            # in order, and leftovers on either side are removed or added
             changes = []
+            extra_added = []
             
-            # Check for removed records
-            for sig, old_records in old_by_sig.items():
-                if sig not in new_by_sig:
-                    for idx, rec in old_records:
-                        changes.append(('removed', idx, rec, None))
-            
-            # Check for added records
-            for sig, new_records in new_by_sig.items():
-                if sig not in old_by_sig:
-                    for idx, rec in new_records:
-                        changes.append(('added', None, None, rec))
-            
-            # Check for modified records (same signature but different content)
-            for sig in set(old_by_sig.keys()) & set(new_by_sig.keys()):
-                old_recs = old_by_sig[sig]
-                new_recs = new_by_sig[sig]
-                
-                # Match records one-to-one
-                for i in range(max(len(old_recs), len(new_recs))):
-                    old_rec = old_recs[i] if i < len(old_recs) else None
-                    new_rec = new_recs[i] if i < len(new_recs) else None
-                    
+            for sig, old_recs in old_by_sig.items():
+                new_recs = new_by_sig.pop(sig, ())
+                for old_rec, new_rec in itertools.zip_longest(old_recs, new_recs):
                     if old_rec and new_rec:
-                        old_str = str(old_rec[1])
-                        new_str = str(new_rec[1])
-                        # Normalize offsets for comparison
-                        import re
-                        old_str = re.sub(r' at 0x[0-9a-f]+', ' at [offset]', old_str)
-                        old_str = re.sub(r'Offset 0x[0-9a-f]+:', 'Offset:', old_str)
-                        new_str = re.sub(r' at 0x[0-9a-f]+', ' at [offset]', new_str)
-                        new_str = re.sub(r'Offset 0x[0-9a-f]+:', 'Offset:', new_str)
+                        # Normalize offsets for comparison; the normalized
+                        # text is kept for the detailed diff below
+                        old_str = normalize_offsets(str(old_rec[1]))
+                        new_str = normalize_offsets(str(new_rec[1]))
                         
                         if old_str != new_str:
-                            changes.append(('modified', old_rec[0], old_rec[1], new_rec[1]))
+                            changes.append(('modified', old_rec[0], old_rec[1], new_rec[1], old_str, new_str))
                     elif old_rec:
-                        changes.append(('removed', old_rec[0], old_rec[1], None))
-                    elif new_rec:
-                        changes.append(('added', None, None, new_rec[1]))
+                        changes.append(('removed', old_rec[0], old_rec[1], None, None, None))
+                    else:
+                        extra_added.append(('added', None, None, new_rec[1], None, None))
+            
+            # Signatures only found in NEW are added records; they are listed
+            # before the extra records of shared signatures
+            for new_recs in new_by_sig.values():
+                changes.extend(('added', None, None, rec, None, None) for _, rec in new_recs)
+            changes.extend(extra_added)
             
             # Sort changes by old index (for removed/modified) or by type
             changes.sort(key=lambda x: (x[0], x[1] if x[1] is not None else 9999))
@@ -327,7 +246,7 @@ def diff_oa_tables(file_old_path, file_new_path):
             if not changes:
                 print("  NOTE: Parsed structure is identical.")
             else:
-                for change_type, old_idx, old_rec, new_rec in changes:
+                for change_type, old_idx, old_rec, new_rec, old_str, new_str in changes:
                     if change_type == 'removed':
                         print(f"  [-] Record {old_idx}: {type(old_rec).__name__} removed")
                     elif change_type == 'added':
@@ -335,15 +254,6 @@ def diff_oa_tables(file_old_path, file_new_path):
                     elif change_type == 'modified':
                         print(f"  [~] Record {old_idx}: {type(old_rec).__name__} modified")
                         # Show detailed diff for modified records
-                        old_str = str(old_rec)
-                        new_str = str(new_rec)
-                        # Normalize offsets
-                        import re
-                        old_str = re.sub(r' at 0x[0-9a-f]+', ' at [offset]', old_str)
-                        old_str = re.sub(r'Offset 0x[0-9a-f]+:', 'Offset:', old_str)
-                        new_str = re.sub(r' at 0x[0-9a-f]+', ' at [offset]', new_str)
-                        new_str = re.sub(r'Offset 0x[0-9a-f]+:', 'Offset:', new_str)
-                        
                         old_lines = old_str.split('\n')
                         new_lines = new_str.split('\n')
                         diff = difflib.unified_diff(old_lines, new_lines, lineterm='')
@@ -362,30 +272,23 @@ def diff_oa_tables(file_old_path, file_new_path):
             print("  --- Structured Diff for Table 0x107 (Object Edit Metadata) ---")
             
             # Get string table for string resolution
-            string_table_old = oa_old.tables.get(0xa, {}).get('data')
-            string_table_new = oa_new.tables.get(0xa, {}).get('data')
+            string_table_old = oa_old.read(0xa)
+            string_table_new = oa_new.read(0xa)
             
             # Parse string tables into lists
             def parse_strings(data):
                 if not data:
                     return []
-                strings = []
-                pos = 0
-                while pos < len(data):
-                    end = data.find(b'\x00', pos)
-                    if end == -1:
-                        break
-                    strings.append(data[pos:end].decode('utf-8', errors='replace'))
-                    pos = end + 1
-                return strings
+                # Drop the trailing piece after the last NUL (unterminated)
+                return [raw.decode('utf-8', errors='replace')
+                        for raw in data.split(b'\x00')[:-1]]
             
             strings_old = parse_strings(string_table_old)
             strings_new = parse_strings(string_table_new)
             
-            parser_old = Table107Parser(data_old, strings_old)
-            parser_new = Table107Parser(data_new, strings_new)
+            parser_old = Table107Parser(bytes(data_old), strings_old)
+            parser_new = Table107Parser(bytes(data_new), strings_new)
             
-            from oaparser.binary_curator import ClaimedRegion
             regions_old = parser_old.parse()
             regions_new = parser_new.parse()
             
@@ -413,20 +316,10 @@ def diff_oa_tables(file_old_path, file_new_path):
         # --- GENERIC HEX DIFF FOR ALL OTHER TABLES ---
         # Use the context=none algorithm from oa_diff2 for raw data dumps
         print("  --- Binary Data Diff (context=none) ---")
-        differences = binary_diff(data_old, data_new)
-        
-        # Print differences with proper indentation
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-        print_diff(differences, context='none')
-        output = sys.stdout.getvalue()
-        sys.stdout = old_stdout
         
-        # Add indentation to all lines
-        for line in output.split('\n'):
-            if line:
-                print(f"  {line}")
-        print()
+        # Print differences with proper indentation, in one write
+        out = [f"  {line}" for line in _binary_diff_lines(data_old, data_new) if line]
+        sys.stdout.write(''.join(line + '\n' for line in out) + '\n')
 
 
 if __name__ == '__main__':
@@ -1,8 +1,18 @@
+import sys
 import os
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import glob
+import hashlib
 import struct
 import difflib
 
+from oaparser import HEADER, unpack_directory
+
+# Save counter stored as a uint32 at offset 0x64 of Table 0x1
+SAVE_COUNTER = struct.Struct('<I')
+
 class ParsedOaFile:
     """
     A container for the semantically meaningful data we can reliably extract
@@ -13,6 +23,8 @@ class ParsedOaFile:
         self.filename = os.path.basename(filepath)
         self.tables = {}
         self.strings = []
+        # Digest of the raw string heap; equal digests mean equal timelines
+        self.strings_digest = None
         self.save_counter = -1
 
         try:
@@ -28,11 +40,9 @@ class ParsedOaFile:
         with open(self.filepath, 'rb') as f:
             # 1. Read the header and table directory to get table locations.
             header = f.read(24)
-            _, _, _, _, _, used = struct.unpack('<IHHQII', header)
+            _, _, _, _, _, used = HEADER.unpack(header)
 
-            ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
+            ids, offsets, sizes = unpack_directory(f.read(24 * used), used, 0)
 
             for i in range(used):
                 self.tables[ids[i]] = {'offset': offsets[i], 'size': sizes[i]}
@@ -47,16 +57,13 @@ class ParsedOaFile:
                 # The string "heap" starts after the 16-byte internal header.
                 string_heap = table_a_data[16:]
 
-                current_offset = 0
-                while current_offset < len(string_heap):
-                    try:
-                        null_pos = string_heap.index(b'\0', current_offset)
-                        string_data = string_heap[current_offset:null_pos]
-                        if string_data:
-                            self.strings.append(string_data.decode('utf-8', 'ignore'))
-                        current_offset = null_pos + 1
-                    except ValueError:
-                        break # No more strings
+                # One split finds every null-terminated slot; the last piece
+                # follows the final null byte and is not a complete string.
+                # Each non-empty slot gives exactly one entry, even if nothing
+                # in it decodes, so entries keep their position in the heap.
+                self.strings = [raw.decode('utf-8', 'ignore')
+                                for raw in string_heap.split(b'\0')[:-1] if raw]
+                self.strings_digest = hashlib.blake2b(string_heap, digest_size=16).digest()
 
             # 3. "Cheat" by grabbing a known save counter from Table 0x1.
             # We know from diffs that a reliable counter exists at offset 0x64
@@ -66,7 +73,7 @@ class ParsedOaFile:
                 f.seek(info['offset'])
                 table_1_data = f.read(info['size'])
                 if len(table_1_data) >= 0x64 + 4:
-                    self.save_counter = struct.unpack_from('<I', table_1_data, 0x64)[0]
+                    self.save_counter = SAVE_COUNTER.unpack_from(table_1_data, 0x64)[0]
 
 def print_semantic_diff(old_file, new_file):
     """
@@ -101,6 +108,12 @@ def print_semantic_diff(old_file, new_file):
     # 3. Compare the most important part: the string timeline
     print("\n[String Timeline Changes]")
 
+    # Consecutive saves often leave the string heap untouched; the digests
+    # tell that apart without running difflib over the whole timeline
+    if old_file.strings_digest == new_file.strings_digest:
+        print("  - No changes to the string timeline.")
+        return
+
     diff = list(difflib.unified_diff(
         old_file.strings,
         new_file.strings,
@@ -1,5 +1,11 @@
-import struct
 import sys
+import os
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import struct
+
+from oaparser import HEADER, unpack_directory
 
 def parse_string_table_deep_dive(filepath):
     """
@@ -11,15 +17,13 @@ def parse_string_table_deep_dive(filepath):
         with open(filepath, 'rb') as f:
             # 1. Find the offset and size of Table 0xa from the main directory
             header = f.read(24)
-            _, _, _, _, _, used = struct.unpack('<IHHQII', header)
+            _, _, _, _, _, used = HEADER.unpack(header)
 
             if used == 0:
                 print("No tables found.")
                 return
 
-            ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
+            ids, offsets, sizes = unpack_directory(f.read(24 * used), used, 0)
 
             string_table_info = None
             for i in range(used):
@@ -42,13 +46,13 @@ def parse_string_table_deep_dive(filepath):
 
             # 2b. Parse the Lookup Map itself
             # We theorize each entry is 8 bytes: <I (logical_id), I (physical_offset)
-            lookup_map = []
-            for _ in range(num_entries):
-                entry = struct.unpack('<II', f.read(8))
-                lookup_map.append({'id': entry[0], 'offset': entry[1]})
+            lookup_map = [{'id': logical_id, 'offset': physical_offset}
+                          for logical_id, physical_offset
+                          in struct.iter_unpack('<II', f.read(8 * num_entries))]
             
-            # The current file position is the start of the string data heap
-            heap_start_pos = f.tell()
+            # The current file position is the start of the string data heap;
+            # read the rest of the file once and find each string in memory
+            heap = f.read()
             
             # 3. Print the results, connecting all three pieces of information
             print("\n" + "="*80)
@@ -59,17 +63,12 @@ def parse_string_table_deep_dive(filepath):
                 logical_id = entry['id']
                 physical_offset = entry['offset']
 
-                # Seek to the string's physical location and read it
-                f.seek(heap_start_pos + physical_offset)
-                
-                string_bytes = []
-                while True:
-                    byte = f.read(1)
-                    if not byte or byte == b'\0':
-                        break
-                    string_bytes.append(byte)
-                
-                decoded_string = b''.join(string_bytes).decode('utf-8', 'replace')
+                # The string runs from its physical offset to the next NUL
+                # (or the end of the file)
+                end = heap.find(b'\0', physical_offset)
+                if end == -1:
+                    end = len(heap)
+                decoded_string = heap[physical_offset:end].decode('utf-8', 'replace')
 
                 # Highlight the key entries we've seen in our analysis
                 highlight = ""
@@ -16,7 +16,8 @@ from parsers.table_1_parser import Table1Parser
 from parsers.table_107_parser import Table107Parser
 
 # Import rendering utilities
-from oaparser import render_report, render_regions_to_string
+from oaparser import open_oa, render_report, render_regions_to_string
+from oaparser.binary_curator import ASCII_TABLE
 
 # --- Generic Dump Utilities ---
 
@@ -28,8 +29,8 @@ def generate_hex_dump(data: bytes, table_id: int):
     lines = [header]
     for i in range(0, len(data), 16):
         chunk = data[i:i+16]
-        hex_part = ' '.join(f'{b:02x}' for b in chunk)
-        ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
+        hex_part = chunk.hex(' ')
+        ascii_part = chunk.translate(ASCII_TABLE).decode('ascii')
         lines.append(f"  {i:08x}: {hex_part:<48} |{ascii_part}|")
     return "\n".join(lines)
 
@@ -43,7 +44,7 @@ def generate_int_array_dump(data: bytes, table_id: int):
     if not data:
         lines.append("  - (Table is empty)")
         return "\n".join(lines)
-    int_array = [struct.unpack_from('<I', data, i)[0] for i in range(0, len(data), 4)]
+    int_array = [value for (value,) in struct.iter_unpack('<I', data)]
     last_num, repeat_count, start_index = None, 0, 0
     for i, num in enumerate(int_array):
         if num == last_num:
@@ -82,100 +83,76 @@ if __name__ == '__main__':
     print(f"--- Running Enhanced Parser on: {filepath} ---")
 
     try:
-        with open(filepath, 'rb') as f:
-            # Read header and table directory
-            header = f.read(24)
-            _, _, _, _, _, used = struct.unpack('<IHHQII', header)
-            ids = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            offsets = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-            sizes = list(struct.unpack(f'<{used}Q', f.read(8 * used)))
-
+        # open_oa() maps the file and parses the header and table directory;
+        # each table is then sliced out of the mapping without a seek and read
+        with open_oa(filepath) as oa:
             # FIRST PASS: Extract string table and parse it
-            string_table_data = None
+            string_table_data = oa.read(0x0a)
             string_list = []
-            for i in range(used):
-                if ids[i] == 0x0a:
-                    f.seek(offsets[i])
-                    string_table_data = f.read(sizes[i])
-                    # Parse string table into list of strings
-                    pos = 0
-                    while pos < len(string_table_data):
-                        end = string_table_data.find(b'\x00', pos)
-                        if end == -1:
-                            break
-                        string_list.append(string_table_data[pos:end].decode('utf-8', errors='replace'))
-                        pos = end + 1
-                    break
-
-            # SECOND PASS: Parse all tables
-            for i in range(used):
-                table_id = ids[i]
-                offset = offsets[i]
-                size = sizes[i]
-
-                if offset == 0xffffffffffffffff or size == 0:
+            if string_table_data is not None:
+                # Parse string table into list of strings; the last split
+                # piece is not NUL-terminated, so it is not a string
+                string_list = [
+                    raw.decode('utf-8', errors='replace')
+                    for raw in string_table_data.split(b'\x00')[:-1]
+                ]
+
+            # SECOND PASS: Parse all tables (inactive ones are left out by open_oa)
+            for table_id, (offset, size) in oa.tables.items():
+                if size == 0:
                     continue
 
                 # --- Specialized Parsers ---
                 if table_id == 0x01:
                     print("\n--- Table 0x1 (Global Metadata) ---")
-                    f.seek(offset)
-                    parser = Table1Parser(f.read(size))
+                    parser = Table1Parser(oa.read(table_id))
                     regions = parser.parse()
                     render_report(regions, f"Global Metadata: {size} bytes")
 
                 elif table_id == 0x0a:
                     print("\n--- Table 0xa (String Table) ---")
-                    f.seek(offset)
-                    parser = TableAParser(f.read(size))
+                    parser = TableAParser(oa.read(table_id))
                     regions = parser.parse()
                     render_report(regions, f"String Table: {size} bytes")
 
                 elif table_id == 0x0b:
                     print("\n--- Table 0xb (Property List) ---")
-                    f.seek(offset)
-                    parser = TableBParser(f.read(size))
+                    parser = TableBParser(oa.read(table_id))
                     regions = parser.parse()
                     render_report(regions, f"Property List: {size} bytes")
 
                 elif table_id == 0x1d:
                     print("\n--- Table 0x1d (Table Directory) ---")
-                    f.seek(offset)
-                    parser = Table1dParser(f.read(size))
+                    parser = Table1dParser(oa.read(table_id))
                     regions = parser.parse()
                     render_report(regions, f"Table Directory: {size} bytes")
 
                 elif table_id == 0x0c:
                     print("\n--- Table 0xc (Netlist Data) ---")
-                    f.seek(offset)
                     # Pass string table data to enable string resolution
-                    parser = HypothesisParser(f.read(size), string_table_data)
+                    parser = HypothesisParser(oa.read(table_id), string_table_data)
                     regions = parser.parse()
                     render_report(regions, f"Netlist Data: {size} bytes")
 
                 elif table_id == 0x107:
                     print("\n--- Table 0x107 (Object Edit Metadata) ---")
-                    f.seek(offset)
                     # Pass string list to enable name pointer resolution
-                    parser = Table107Parser(f.read(size), string_list)
+                    parser = Table107Parser(oa.read(table_id), string_list)
                     regions = parser.parse()
                     render_report(regions, f"Object Edit Metadata: {size} bytes")
 
                 elif table_id == 0x133:
                     print("\n--- Table 0x133 ---")
-                    f.seek(offset)
-                    parser = Table133Parser(f.read(size))
+                    parser = Table133Parser(oa.read(table_id))
                     regions = parser.parse()
                     render_report(regions, f"Table 0x133: {size} bytes")
 
                 # --- Generic Dumpers (if flags are used) ---
                 elif dump_hex:
-                    f.seek(offset)
-                    print("\n" + generate_hex_dump(f.read(size), table_id))
+                    print("\n" + generate_hex_dump(oa.read(table_id), table_id))
 
                 elif dump_int:
-                    f.seek(offset)
-                    print("\n" + generate_int_array_dump(f.read(size), table_id))
+                    print("\n" + generate_int_array_dump(oa.read(table_id), table_id))
 
     except FileNotFoundError:
         print(f"ERROR: File not found at '{filepath}'")